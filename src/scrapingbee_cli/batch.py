@@ -7,7 +7,9 @@ import hashlib
 import os
 import sys
 import time
+from collections import deque
 from collections.abc import Awaitable, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -223,7 +225,10 @@ def read_input_file(path: str, *, input_column: str | None = None) -> list[str]:
         path = resolve_output_path(path)
 
     if path == "-":
-        lines = [line.strip() for line in _sys.stdin if line.strip()]
+        # Same bulk-read shape as the file branch below: one read, one decode,
+        # one C-level splitlines instead of per-line iteration.
+        data = _sys.stdin.buffer.read()
+        lines = [s for line in data.decode("utf-8").splitlines() if (s := line.strip())]
     elif path.lower().endswith(".csv"):
         import csv
 
@@ -261,11 +266,12 @@ def read_input_file(path: str, *, input_column: str | None = None) -> list[str]:
                 lines.append(row[col_idx].strip())
     else:
         try:
-            fh = open(path, encoding="utf-8")
+            data = Path(path).read_bytes()
         except OSError as e:
             raise ValueError(f'cannot open input file "{path}": {e}') from e
-        with fh:
-            lines = [line.strip() for line in fh if line.strip()]
+        # One bulk read + C-level splitlines instead of per-line Python
+        # iteration — noticeably faster on multi-MB URL lists.
+        lines = [s for line in data.decode("utf-8").splitlines() if (s := line.strip())]
     if not lines:
         raise ValueError(f'input file "{path}" has no non-empty lines')
     return lines
@@ -310,8 +316,13 @@ def sample_inputs(inputs: list[str], n: int) -> list[str]:
 
 
 async def _fetch_usage_async(api_key: str) -> dict:
-    """Fetch usage from API (async)."""
-    async with Client(api_key) as client:
+    """Fetch usage from API (async).
+
+    The /usage endpoint answers in well under a second; a short total timeout
+    keeps callers like the REPL version banner from hanging on a stalled
+    network (the Client default of 150 s is sized for scrape responses).
+    """
+    async with Client(api_key, timeout=10) as client:
         body, _, code = await client.usage()
         if code != 200:
             raise RuntimeError(f"usage API returned HTTP {code}")
@@ -323,8 +334,9 @@ async def _fetch_usage_async(api_key: str) -> dict:
 # File lock prevents cache stampede: when the cache is stale, only ONE process
 # fetches from the API; all others wait and then read the freshly written value.
 
-_usage_cache: dict | None = None
-_usage_cache_time: float = 0
+# In-process cache: key hash → (monotonic timestamp, usage dict). Pipelines that
+# launch batch after batch from one process skip the /usage roundtrip within the TTL.
+_usage_cache: dict[str, tuple[float, dict]] = {}
 _USAGE_CACHE_TTL = 12  # seconds — with a sliding-window rate limit of 6/min, using
 # exactly 10s yields 7 calls in any 60s window (T=0..60). 12s → at most 5 calls/min.
 
@@ -405,19 +417,37 @@ def _release_usage_lock(lf: object) -> None:
         pass
 
 
+def seed_usage_cache(api_key: str, usage: dict) -> None:
+    """Prime the in-process usage cache with an already-fetched result.
+
+    Lets callers that hit ``/usage`` themselves (the REPL refresher, the
+    version banner) share their result, so a batch pre-flight inside the
+    TTL skips the roundtrip entirely.
+    """
+    _usage_cache[_key_hash(api_key)] = (time.monotonic(), usage)
+
+
 def get_batch_usage(api_key_flag: str | None) -> dict:
     """Return usage info (max_concurrency, credits).
 
-    Inside the REPL the file cache (12 s TTL) is consulted first so the
+    A per-process TTL cache (12 s, keyed by API key) serves repeated calls
+    within one process — e.g. scripted pipelines launching batch after
+    batch — without re-hitting the ``/usage`` endpoint.
+
+    Inside the REPL the file cache (same TTL) is consulted next so the
     several REPL-side callers (background refresher, batch / crawl
     pre-flight) share a single live call per window and stay under the
     ``/usage`` rate limit.
 
     Direct CLI invocations (``scrapingbee crawl ...`` outside the REPL)
-    keep their original behaviour: a live call every time, unless the
-    legacy ``SCRAPINGBEE_USAGE_CACHE=1`` test escape hatch is set.
+    otherwise keep their original behaviour: a live call per process,
+    unless the legacy ``SCRAPINGBEE_USAGE_CACHE=1`` test escape hatch is set.
     """
     key = get_api_key(api_key_flag)
+    khash = _key_hash(key)
+    entry = _usage_cache.get(khash)
+    if entry is not None and time.monotonic() - entry[0] < _USAGE_CACHE_TTL:
+        return entry[1]
     try:
         from .theme import is_repl_mode
 
@@ -426,16 +456,17 @@ def get_batch_usage(api_key_flag: str | None) -> dict:
         _in_repl = False
     cache_opt_in = _in_repl or os.environ.get("SCRAPINGBEE_USAGE_CACHE") == "1"
     if cache_opt_in:
-        cached = read_usage_file_cache(key)
-        if cached is not None:
-            return cached
+        result = read_usage_file_cache(key)
+        if result is None:
+            result = asyncio.run(_fetch_usage_async(key))
+            try:
+                write_usage_file_cache(key, result)
+            except Exception:
+                pass
+    else:
         result = asyncio.run(_fetch_usage_async(key))
-        try:
-            write_usage_file_cache(key, result)
-        except Exception:
-            pass
-        return result
-    return asyncio.run(_fetch_usage_async(key))
+    _usage_cache[khash] = (time.monotonic(), result)
+    return result
 
 
 MIN_CREDITS_TO_RUN_BATCH = 100
@@ -447,12 +478,12 @@ def validate_batch_run(user_concurrency: int, num_inputs: int, usage: dict) -> N
     reliably estimate cost for batch/crawl). Concurrency: block when user
     --concurrency exceeds plan limit."""
     max_concurrency = usage.get("max_concurrency", 5)
+    credits = usage.get("credits", 0)
     if user_concurrency > 0 and user_concurrency > max_concurrency:
         raise ValueError(
             f"concurrency {user_concurrency} exceeds your plan limit of {max_concurrency} "
             "(check with: scrapingbee usage)"
         )
-    credits = usage.get("credits", 0)
     if credits < MIN_CREDITS_TO_RUN_BATCH:
         raise ValueError(
             f"insufficient credits: {credits} available (need at least {MIN_CREDITS_TO_RUN_BATCH} to run batch). "
@@ -463,11 +494,26 @@ def validate_batch_run(user_concurrency: int, num_inputs: int, usage: dict) -> N
 CONCURRENCY_CAP = 100
 
 
+def _client_concurrency_ceiling() -> int:
+    """Upper bound for auto concurrency based on this machine's usable CPUs.
+
+    I/O-bound requests tolerate far more in-flight work than cores
+    (Little's law: concurrency = arrival rate x latency), hence the 4x
+    multiplier; the floor of 8 keeps small plans unthrottled on tiny VMs.
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # macOS / Windows: no sched_getaffinity
+        cpus = os.cpu_count() or 1
+    return max(8, 4 * cpus)
+
+
 def resolve_batch_concurrency(
     user_concurrency: int, usage: dict, num_inputs: int, *, warn: bool = True
 ) -> int:
     """Return concurrency to use: user value if set (capped at plan limit and CONCURRENCY_CAP),
-    else usage limit (at least 1). When from user, caps at min(plan_limit, CONCURRENCY_CAP)."""
+    else usage limit capped at the client's own capacity (at least 1). When from user,
+    caps at min(plan_limit, CONCURRENCY_CAP)."""
     from_usage = usage.get("max_concurrency", 5) or 5
     if user_concurrency > 0:
         cap = min(from_usage, CONCURRENCY_CAP)
@@ -484,7 +530,10 @@ def resolve_batch_concurrency(
                     err=True,
                 )
         return min(user_concurrency, cap)
-    return max(1, from_usage)
+    # Auto mode: the plan limit is an upper bound, not a target — on a small
+    # client VM, saturating a big plan's limit just over-threads the network
+    # stack. Clamp to what this machine can reasonably keep in flight.
+    return max(1, min(from_usage, _client_concurrency_ceiling()))
 
 
 @dataclass
@@ -493,7 +542,10 @@ class BatchResult:
 
     index: int
     input: str
-    body: bytes
+    # bytes from aiohttp today; bytearray is accepted so a streaming client
+    # can hand over its receive buffer without a final O(n) bytes() copy
+    # (every consumer — os.write, sha256, decode — takes either).
+    body: bytes | bytearray
     headers: dict
     status_code: int
     error: Exception | None
@@ -525,8 +577,12 @@ def _find_completed_n(output_dir: str) -> frozenset[int]:
             continue
         if p.suffix.lstrip(".") == "err":
             continue
+        stem = p.stem
+        if p.suffix == ".gz":
+            # --compress gzip output: "12.html.gz" → stem "12.html" → "12".
+            stem = Path(stem).stem
         try:
-            completed.add(int(p.stem))
+            completed.add(int(stem))
         except ValueError:
             continue
     return frozenset(completed)
@@ -546,6 +602,142 @@ def _format_eta(seconds: float) -> str:
     return f"{h}h {m}m" if m else f"{h}h"
 
 
+class _ResizableSemaphore:
+    """Async semaphore whose limit can change while tasks are in flight.
+
+    ``asyncio.Semaphore`` cannot shrink safely once acquired; this tracks an
+    active count against a mutable limit and wakes waiters whenever capacity
+    appears (release or a raised limit).
+    """
+
+    def __init__(self, limit: int):
+        self._limit = max(1, limit)
+        self._active = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    async def set_limit(self, limit: int) -> None:
+        async with self._cond:
+            self._limit = max(1, limit)
+            self._cond.notify_all()
+
+    async def __aenter__(self) -> _ResizableSemaphore:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self._limit)
+            self._active += 1
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify(1)
+
+
+_http_errors: dict[int, RuntimeError] = {}
+
+
+def http_status_error(status_code: int) -> RuntimeError:
+    """Return a shared RuntimeError for an HTTP status code.
+
+    Batch do_one closures *return* these errors rather than raising them, so
+    a per-code singleton is safe to hand out repeatedly — it never grows a
+    traceback. Against a rate-limited endpoint a large batch can produce
+    thousands of identical "HTTP 429" failures; sharing one instance per code
+    skips an f-string format and an exception allocation on each.
+    """
+    err = _http_errors.get(status_code)
+    if err is None:
+        err = _http_errors[status_code] = RuntimeError(f"HTTP {status_code}")
+    return err
+
+
+class _AimdController:
+    """AIMD concurrency tuner for run_batch_async.
+
+    A fixed concurrency ignores changing network/server conditions over a
+    long run. This controller watches the last WINDOW completions: when the
+    backpressure rate (HTTP 429/503 or transport errors) crosses the
+    threshold it halves the in-flight limit; when a full clean window goes
+    by below the starting cap it adds one back. The limit never exceeds the
+    cap the batch started with, so plan limits are always respected.
+    """
+
+    WINDOW = 16
+    ERROR_RATE_THRESHOLD = 0.25
+
+    def __init__(self, cap: int):
+        self._cap = cap
+        self._events: deque[bool] = deque(maxlen=self.WINDOW)
+        #: Times the limit was halved / grown back, for the end-of-run summary.
+        self.halvings = 0
+        self.growths = 0
+
+    def record(self, status_code: int, error: Exception | None, current_limit: int) -> int | None:
+        """Record one completion; return the new limit when an adjustment is due.
+
+        Only genuine backpressure counts: HTTP 429/503, or a transport failure
+        (status_code 0 — the request never got a response). Application-level
+        4xx like 404 carry an error too, but slowing down will not fix them.
+        """
+        self._events.append(status_code in (429, 503) or (error is not None and status_code == 0))
+        if len(self._events) < self.WINDOW:
+            return None
+        rate = sum(self._events) / len(self._events)
+        if rate >= self.ERROR_RATE_THRESHOLD and current_limit > 1:
+            self._events.clear()
+            self.halvings += 1
+            return max(1, current_limit // 2)
+        if rate == 0 and current_limit < self._cap:
+            self._events.clear()
+            self.growths += 1
+            return current_limit + 1
+        return None
+
+
+async def _hedged_call(
+    async_fn: AsyncBatchFn,
+    inp: str,
+    hedge_after_ms: int,
+    hedge_sem: asyncio.Semaphore,
+) -> tuple[bytes, dict, int, BaseException | None, str | None]:
+    """Tail-latency hedge: duplicate a request still running after the cutoff.
+
+    Fires async_fn once; if it is still outstanding after *hedge_after_ms*,
+    launches one duplicate and returns whichever finishes first (the loser is
+    cancelled). A duplicate costs an extra credit, so hedging is opt-in and
+    *hedge_sem* bounds the duplicates in flight — when no slot is free we
+    simply keep waiting on the primary rather than queue more load.
+    """
+    primary = asyncio.ensure_future(async_fn(inp))
+    try:
+        return await asyncio.wait_for(asyncio.shield(primary), hedge_after_ms / 1000.0)
+    except asyncio.TimeoutError:
+        pass
+    except BaseException:
+        primary.cancel()
+        raise
+    if hedge_sem.locked():
+        return await primary
+    async with hedge_sem:
+        backup = asyncio.ensure_future(async_fn(inp))
+        try:
+            done, pending = await asyncio.wait(
+                {primary, backup}, return_when=asyncio.FIRST_COMPLETED
+            )
+        except BaseException:
+            primary.cancel()
+            backup.cancel()
+            raise
+        for task in pending:
+            task.cancel()
+        # Both can land in ``done`` on a photo finish — prefer a clean result.
+        winner = min(done, key=lambda t: t.exception() is not None)
+        return winner.result()
+
+
 async def run_batch_async(
     inputs: list[str],
     concurrency: int,
@@ -555,6 +747,7 @@ async def run_batch_async(
     skip_n: frozenset[int] = frozenset(),
     show_progress: bool = True,
     on_result: Callable[[BatchResult], None] | None = None,
+    hedge_after_ms: int = 0,
 ) -> list[BatchResult]:
     """Run async_fn for each input with up to concurrency in flight; preserve order."""
     concurrency = min(max(1, concurrency), len(inputs))
@@ -564,7 +757,12 @@ async def run_batch_async(
         styled_echo(f"Batch: {total} items, concurrency {concurrency} ({source})", style="info")
     else:
         click.echo(f"Batch: {total} items, concurrency {concurrency} ({source})", err=True)
-    sem = asyncio.Semaphore(concurrency)
+    sem = _ResizableSemaphore(concurrency)
+    controller = _AimdController(concurrency)
+    # Hedge slots sit on top of the primary semaphore, so worst case is
+    # 2×concurrency requests in flight (matching the connector's socket pool
+    # plus the hedges waiting on it).
+    hedge_sem = asyncio.Semaphore(concurrency) if hedge_after_ms > 0 else None
     completed = 0
     failure_count = 0
     start_time = time.monotonic()
@@ -597,7 +795,12 @@ async def run_batch_async(
                 t0 = time.monotonic()
                 fetched_at = datetime.now(timezone.utc).isoformat()
                 try:
-                    body, headers, status_code, err, expected_ext = await async_fn(inp)
+                    if hedge_sem is not None:
+                        body, headers, status_code, err, expected_ext = await _hedged_call(
+                            async_fn, inp, hedge_after_ms, hedge_sem
+                        )
+                    else:
+                        body, headers, status_code, err, expected_ext = await async_fn(inp)
                 except Exception as e:
                     body, headers, status_code, err, expected_ext = b"", {}, 0, e, None
                 latency_ms = int((time.monotonic() - t0) * 1000)
@@ -612,6 +815,9 @@ async def run_batch_async(
                 fetched_at=fetched_at,
                 latency_ms=latency_ms,
             )
+            new_limit = controller.record(result.status_code, result.error, sem.limit)
+            if new_limit is not None:
+                await sem.set_limit(new_limit)
         completed += 1
         if result.error and not result.skipped:
             failure_count += 1
@@ -654,13 +860,55 @@ async def run_batch_async(
             on_result(result)
         return i, result
 
-    tasks = [run_one(i, inp) for i, inp in enumerate(inputs)]
+    async def run_one_guarded(i: int, inp: str) -> tuple[int, BatchResult]:
+        try:
+            return await run_one(i, inp)
+        except Exception as e:
+            return i, BatchResult(
+                index=i,
+                input=inp,
+                body=b"",
+                headers={},
+                status_code=0,
+                error=e,
+            )
+
+    # Sliding-window submit: keep at most 2×concurrency tasks alive instead of
+    # materializing one Task per input up front. The semaphore still gates
+    # actual in-flight requests; the window bounds Task bookkeeping (and the
+    # response bodies those tasks eventually hold) to O(concurrency) so a
+    # million-line input file does not balloon memory before the first item
+    # completes.
+    window = max(1, concurrency * 2)
+    results: list[BatchResult] = []
+    pending: set[asyncio.Task[tuple[int, BatchResult]]] = set()
+    input_iter = iter(enumerate(inputs))
     try:
-        ordered = await asyncio.gather(*tasks, return_exceptions=True)
+        if total == 1:
+            # Fast path: a single-item batch (common when scripting) needs no
+            # task window or asyncio.wait bookkeeping — await it directly.
+            _, only = await run_one_guarded(0, inputs[0])
+            results.append(only)
+        else:
+            while True:
+                while len(pending) < window:
+                    try:
+                        i, inp = next(input_iter)
+                    except StopIteration:
+                        break
+                    pending.add(asyncio.ensure_future(run_one_guarded(i, inp)))
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    _, result = task.result()
+                    results.append(result)
     finally:
         # Stop the REPL's ticker from re-rendering the progress widget
         # now that the batch is done (or cancelled). Safe to call even
         # when state was never set.
+        for task in pending:
+            task.cancel()
         if is_repl_mode():
             try:
                 from .theme import clear_progress_state
@@ -668,28 +916,54 @@ async def run_batch_async(
                 clear_progress_state()
             except Exception:
                 pass
-    results: list[BatchResult] = []
-    for i, item in enumerate(ordered):
-        if isinstance(item, BaseException):
-            results.append(
-                BatchResult(
-                    index=i,
-                    input=inputs[i],
-                    body=b"",
-                    headers={},
-                    status_code=0,
-                    error=item if isinstance(item, Exception) else RuntimeError(str(item)),
-                )
-            )
-            continue
-        _, result = item
-        results.append(result)
+    # Results accumulate in completion order; one in-place sort restores
+    # input order without preallocating an N-slot placeholder list (and the
+    # second is-not-None pass it used to need).
+    results.sort(key=lambda r: r.index)
+    if controller.halvings:
+        # Only worth a line when backpressure actually forced a downshift.
+        msg = (
+            f"Concurrency auto-tuned during run: {controller.halvings} downshift(s), "
+            f"{controller.growths} recovery step(s); ended at {sem.limit} (cap {concurrency})"
+        )
+        if is_repl_mode():
+            styled_echo(msg, style="info")
+        else:
+            click.echo(msg, err=True)
     return results
 
 
+def run_batch(
+    inputs: list[str],
+    concurrency: int,
+    async_fn: AsyncBatchFn,
+    *,
+    from_user: bool = False,
+    skip_n: frozenset[int] = frozenset(),
+    show_progress: bool = True,
+    on_result: Callable[[BatchResult], None] | None = None,
+    hedge_after_ms: int = 0,
+) -> list[BatchResult]:
+    """Sync shim over run_batch_async for callers without a running event loop."""
+    return asyncio.run(
+        run_batch_async(
+            inputs,
+            concurrency,
+            async_fn,
+            from_user=from_user,
+            skip_n=skip_n,
+            show_progress=show_progress,
+            on_result=on_result,
+            hedge_after_ms=hedge_after_ms,
+        )
+    )
+
+
 def default_batch_output_dir() -> str:
     """Default folder name for batch output (batch_<timestamp>)."""
-    return "batch_" + datetime.now().strftime("%Y%m%d_%H%M%S")
+    # time.strftime over datetime.now().strftime: same output, no throwaway
+    # datetime object (tzinfo lookup, microseconds) per call.
+    return "batch_" + time.strftime("%Y%m%d_%H%M%S", time.localtime())
 
 
 def _credits_used_from_headers(headers: dict) -> int | None:
@@ -699,6 +973,14 @@ def _credits_used_from_headers(headers: dict) -> int | None:
     estimate — the cost model changes and not every endpoint returns it, so a guess is worse
     than none. (This is why single scrapes don't print a credit count.)
     """
+    # Fast path: the API sends the canonical casing, so one .get usually hits
+    # and the per-item linear scan below only runs for oddly-cased headers.
+    v = headers.get("Spb-Cost")
+    if v:
+        try:
+            return int(v)
+        except (ValueError, TypeError):
+            return None
     for k, v in headers.items():
         if k.lower() == "spb-cost" and v:
             try:
@@ -708,50 +990,110 @@ def _credits_used_from_headers(headers: dict) -> int | None:
     return None
 
 
-def write_batch_output_to_dir(
-    results: list[BatchResult],
-    output_dir: str | None,
-    verbose: bool,
-    post_process: str | None = None,
-) -> tuple[str, int, int]:
-    """Write 1.<ext>, 2.<ext>, ... and N.err for failures.  Returns ``(output_dir, succeeded, failed)``.
+def _write_file_bytes(path: str, body: bytes | bytearray | memoryview) -> None:
+    """Write *body* to *path* via os.open/os.write — one syscall per step.
 
-    Writes failures.txt at the end listing each failed item (index, input, error). Each N.err
-    is a JSON object with ``error``, ``status_code``, ``body``, and ``input`` keys.
-    Writes manifest.json mapping each input to its file path plus fetched_at, http_status,
-    credits_used, latency_ms, and content_sha256.
+    Skips Python's BufferedWriter layer (and its user-space copy); the open/
+    write/close triple is the minimum syscall count for a whole-file write.
+    Loops on the (rare) short write for very large bodies.
     """
-    import json as _json
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(body)
+        while len(view):
+            written = os.write(fd, view)
+            view = view[written:]
+        # Batch output is write-and-forget — the CLI never reads it back.
+        # Tell the kernel to drop the cached pages so a 10k-file batch does
+        # not evict hot data on shared hosts. Advisory only; not on Windows.
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            except OSError:
+                pass
+    finally:
+        os.close(fd)
 
-    output_dir = output_dir or default_batch_output_dir()
-    abs_dir = str(Path(output_dir).resolve())
-    os.makedirs(abs_dir, exist_ok=True)
 
-    # Load existing manifest from output_dir to carry forward skipped (--resume) entries.
-    existing_manifest: dict = {}
-    existing_manifest_path = os.path.join(abs_dir, "manifest.json")
-    if os.path.exists(existing_manifest_path):
-        try:
-            with open(existing_manifest_path, encoding="utf-8") as mf:
-                existing_manifest = _json.load(mf)
-        except Exception:
-            existing_manifest = {}
+class BatchDirWriter:
+    """Incremental writer for batch output directories.
 
-    failures: list[tuple[int, str, str]] = []  # (index+1, input, error_msg)
-    manifest: dict[str, dict] = {}
-    for result in results:
+    ``write_result`` commits one item's output file the moment it is called,
+    so the streaming path in ``_run_api_batch_async`` can hand each body to
+    disk as it completes and drop the reference — O(concurrency) memory
+    instead of holding every response until the batch finishes.
+    ``finalize`` writes failures.txt, manifest.json, and the batch meta file.
+    """
+
+    def __init__(
+        self,
+        output_dir: str | None,
+        verbose: bool,
+        post_process: str | None = None,
+        compress: str = "none",
+    ):
+        import json as _json
+
+        self.verbose = verbose
+        self.post_process = post_process
+        # "gzip" writes each body as N.<ext>.gz — HTML/JSON typically shrinks
+        # 5-10x, and the compression runs on the writer pool so it overlaps
+        # request completions instead of stalling the event loop.
+        self.compress = compress
+        self.abs_dir = str(Path(output_dir or default_batch_output_dir()).resolve())
+        os.makedirs(self.abs_dir, exist_ok=True)
+
+        # Load existing manifest to carry forward skipped (--resume) entries.
+        self._existing_manifest: dict = {}
+        existing_manifest_path = os.path.join(self.abs_dir, "manifest.json")
+        if os.path.exists(existing_manifest_path):
+            try:
+                with open(existing_manifest_path, encoding="utf-8") as mf:
+                    self._existing_manifest = _json.load(mf)
+            except Exception:
+                self._existing_manifest = {}
+
+        self.failures: list[tuple[int, str, str]] = []  # (index+1, input, error_msg)
+        self.manifest: dict[str, dict] = {}
+        self.total = 0
+        # Directory prefixes (with trailing separator) per subdir, built — and
+        # the subdir mkdir'd — once instead of os.path.join + makedirs per item.
+        self._subdir_prefix: dict[str | None, str] = {None: os.path.join(self.abs_dir, "")}
+        # Body writes go through a small thread pool so the syscall +
+        # page-cache copy overlaps with ongoing request completions (and, on
+        # the streaming path, stays off the event loop thread). Created
+        # lazily on the first successful item.
+        self._writer_pool: ThreadPoolExecutor | None = None
+        self._pending_writes: deque[Future[None]] = deque()
+        self._max_pending_writes = 2 * min(4, os.cpu_count() or 1)
+        # Failures are appended to a single errors.jsonl (one fd, O_APPEND)
+        # instead of one {n}.err file each — a rate-limited batch can fail
+        # thousands of items, and per-file inode allocation is serialized on
+        # ext4/xfs. Lines are coalesced into 64 KB flushes so a high error
+        # rate costs one write syscall per ~hundred failures, not per item.
+        # SCRAPINGBEE_LEGACY_ERR_FILES=1 restores per-item files.
+        self._errors_fd: int | None = None
+        self._error_buf: list[bytes] = []
+        self._error_buf_len = 0
+        self._error_flush_bytes = 64 * 1024
+        self._legacy_err_files = os.environ.get("SCRAPINGBEE_LEGACY_ERR_FILES") == "1"
+
+    def write_result(self, result: BatchResult) -> None:
+        """Write one item's output (or .err) file and record its manifest entry."""
+        import json as _json
+
+        self.total += 1
         n = result.index + 1
         if result.skipped:
-            if verbose:
+            if self.verbose:
                 click.echo(f"Item {n}: skipped (already completed)", err=True)
-            if result.input in existing_manifest:
-                manifest[result.input] = existing_manifest[result.input]
-            continue
+            if result.input in self._existing_manifest:
+                self.manifest[result.input] = self._existing_manifest[result.input]
+            return
         if result.error is not None:
             err_msg = str(result.error)
-            failures.append((n, result.input, err_msg))
+            self.failures.append((n, result.input, err_msg))
             click.echo(f"Item {n} ({result.input!r}): {result.error}", err=True)
-            err_path = os.path.join(abs_dir, f"{n}.err")
             err_body = ""
             if result.body:
                 try:
@@ -764,14 +1106,22 @@ def write_batch_output_to_dir(
                 "input": result.input,
                 "body": err_body,
             }
-            with open(err_path, "w", encoding="utf-8") as out_file:
-                _json.dump(err_obj, out_file, indent=2, ensure_ascii=False)
-            continue
-        if verbose:
+            if self._legacy_err_files:
+                err_path = f"{self._subdir_prefix[None]}{n}.err"
+                with open(err_path, "w", encoding="utf-8") as out_file:
+                    _json.dump(err_obj, out_file, indent=2, ensure_ascii=False)
+                return
+            err_obj = {"index": n, **err_obj}
+            line = _json.dumps(err_obj, separators=(",", ":"), ensure_ascii=False)
+            self._error_buf.append(line.encode("utf-8") + b"\n")
+            self._error_buf_len += len(self._error_buf[-1])
+            if self._error_buf_len >= self._error_flush_bytes:
+                self._flush_errors()
+            return
+        if self.verbose:
             click.echo(f"Item {n}: HTTP {result.status_code}", err=True)
 
         credits_used = _credits_used_from_headers(result.headers)
-        content_sha256 = hashlib.sha256(result.body).hexdigest()
 
         ext = extension_for_crawl(
             result.input,
@@ -780,40 +1130,128 @@ def write_batch_output_to_dir(
             result.expected_extension,
         )
         subdir = _batch_subdir_for_extension(ext)
+        # Format the "{n}.{ext}" name once and concatenate — out_path and rel
+        # share it, so each item pays for a single formatting pass.
+        name = f"{n}.{ext}.gz" if self.compress == "gzip" else f"{n}.{ext}"
         if subdir:
-            out_dir = os.path.join(abs_dir, subdir)
-            os.makedirs(out_dir, exist_ok=True)
-            out_path = os.path.join(out_dir, f"{n}.{ext}")
-            rel = f"{subdir}/{n}.{ext}"
+            prefix = self._subdir_prefix.get(subdir)
+            if prefix is None:
+                os.makedirs(os.path.join(self.abs_dir, subdir), exist_ok=True)
+                prefix = os.path.join(self.abs_dir, subdir, "")
+                self._subdir_prefix[subdir] = prefix
+            out_path = prefix + name
+            rel = f"{subdir}/{name}"
         else:
-            out_path = os.path.join(abs_dir, f"{n}.{ext}")
-            rel = f"{n}.{ext}"
-        write_body = apply_post_process(result.body, post_process) if post_process else result.body
-        with open(out_path, "wb") as out_file:
-            out_file.write(write_body)
-        manifest[result.input] = {
+            out_path = self._subdir_prefix[None] + name
+            rel = name
+        if self._writer_pool is None:
+            self._writer_pool = ThreadPoolExecutor(
+                max_workers=min(4, os.cpu_count() or 1),
+                thread_name_prefix="batch-writer",
+            )
+        entry = {
             "file": rel,
             "fetched_at": result.fetched_at,
             "http_status": result.status_code,
             "credits_used": credits_used,
             "latency_ms": result.latency_ms,
-            "content_sha256": content_sha256,
+            "content_sha256": "",
         }
-    if failures:
-        failures_path = os.path.join(abs_dir, "failures.txt")
-        with open(failures_path, "w", encoding="utf-8") as f:
-            f.write("Batch failures (index, input, error):\n\n")
-            for n, inp, err_msg in failures:
-                f.write(f"  {n}. {inp!r}\n    {err_msg}\n\n")
-    if manifest:
-        manifest_path = os.path.join(abs_dir, "manifest.json")
-        with open(manifest_path, "w", encoding="utf-8") as f:
-            _json.dump(manifest, f, indent=2, ensure_ascii=False)
-    # Store batch metadata alongside manifest for --resume discovery
-    _save_batch_meta(abs_dir, len(results), len(manifest), len(failures))
-    succeeded = len(manifest)
-    failed = len(failures)
-    return abs_dir, succeeded, failed
+        # The whole per-body pipeline — post-process subprocess, sha256,
+        # file write — runs on the writer pool: on the streaming path
+        # write_result is called from the event loop thread, which must
+        # stay free to drive in-flight requests. The manifest entry is
+        # filled in by the task; finalize() drains all tasks before the
+        # manifest is written.
+        body = result.body
+        post_process = self.post_process
+        compress = self.compress
+
+        def _process_and_write() -> None:
+            write_body = apply_post_process(body, post_process) if post_process else body
+            # Hash the logical content, not the compressed container, so the
+            # manifest digest is stable across --compress settings.
+            entry["content_sha256"] = hashlib.sha256(write_body).hexdigest()
+            if compress == "gzip":
+                import gzip
+
+                # mtime=0 keeps the output deterministic for identical bodies.
+                write_body = gzip.compress(write_body, compresslevel=6, mtime=0)
+            _write_file_bytes(out_path, write_body)
+
+        # Bounded handoff: once the queue is full, wait on the oldest write so
+        # bodies never pile up faster than the disk drains them. This also
+        # surfaces write errors close to the item that caused them.
+        while len(self._pending_writes) >= self._max_pending_writes:
+            self._pending_writes.popleft().result()
+        self._pending_writes.append(self._writer_pool.submit(_process_and_write))
+        self.manifest[result.input] = entry
+
+    def _flush_errors(self) -> None:
+        """Write buffered errors.jsonl lines in one append, opening the fd lazily."""
+        if not self._error_buf:
+            return
+        if self._errors_fd is None:
+            self._errors_fd = os.open(
+                os.path.join(self.abs_dir, "errors.jsonl"),
+                os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+                0o644,
+            )
+        os.write(self._errors_fd, b"".join(self._error_buf))
+        self._error_buf.clear()
+        self._error_buf_len = 0
+
+    def finalize(self) -> tuple[str, int, int]:
+        """Write failures.txt / manifest.json / batch meta. Returns ``(output_dir, succeeded, failed)``."""
+        import json as _json
+
+        # Drain outstanding body writes before committing the manifest — a
+        # failed write must abort the batch the way an inline write would.
+        while self._pending_writes:
+            self._pending_writes.popleft().result()
+        if self._writer_pool is not None:
+            self._writer_pool.shutdown(wait=True)
+            self._writer_pool = None
+        self._flush_errors()
+        if self._errors_fd is not None:
+            os.close(self._errors_fd)
+            self._errors_fd = None
+        if self.failures:
+            failures_path = os.path.join(self.abs_dir, "failures.txt")
+            with open(failures_path, "w", encoding="utf-8") as f:
+                f.write("Batch failures (index, input, error):\n\n")
+                for n, inp, err_msg in self.failures:
+                    f.write(f"  {n}. {inp!r}\n    {err_msg}\n\n")
+        if self.manifest:
+            manifest_path = os.path.join(self.abs_dir, "manifest.json")
+            with open(manifest_path, "w", encoding="utf-8") as f:
+                _json.dump(self.manifest, f, indent=2, ensure_ascii=False)
+        # Store batch metadata alongside manifest for --resume discovery
+        _save_batch_meta(self.abs_dir, self.total, len(self.manifest), len(self.failures))
+        return self.abs_dir, len(self.manifest), len(self.failures)
+
+
+def write_batch_output_to_dir(
+    results: list[BatchResult],
+    output_dir: str | None,
+    verbose: bool,
+    post_process: str | None = None,
+) -> tuple[str, int, int]:
+    """Write 1.<ext>, 2.<ext>, ... and N.err for failures.  Returns ``(output_dir, succeeded, failed)``.
+
+    Writes failures.txt at the end listing each failed item (index, input, error). Each N.err
+    is a JSON object with ``error``, ``status_code``, ``body``, and ``input`` keys.
+    Writes manifest.json mapping each input to its file path plus fetched_at, http_status,
+    credits_used, latency_ms, and content_sha256.
+
+    Buffered wrapper around :class:`BatchDirWriter` for callers that already
+    hold all results in memory; the CLI batch path streams through the writer
+    directly instead.
+    """
+    writer = BatchDirWriter(output_dir, verbose, post_process=post_process)
+    for result in results:
+        writer.write_result(result)
+    return writer.finalize()
 
 
 _BATCH_META_FILE = ".batch_meta.json"
@@ -968,10 +1406,8 @@ def update_csv_with_results(
     return dest, succeeded, failed
 
 
-def apply_post_process(body: bytes, cmd: str) -> bytes:
-    """Run shell command with body as stdin, return stdout. On failure, return original body."""
-    import subprocess
-
+def _gate_post_process(cmd: str) -> None:
+    """Run the exec gate + audit log + warning for a --post-process command."""
     from .audit import log_exec
     from .exec_gate import require_exec
 
@@ -979,6 +1415,12 @@ def apply_post_process(body: bytes, cmd: str) -> bytes:
     log_exec("post-process", cmd)
     click.echo(f"⚠ Executing: {cmd.split()[0] if cmd.split() else cmd} (whitelisted)", err=True)
 
+
+def _run_post_process_cmd(body: bytes, cmd: str) -> bytes:
+    """Run an already-gated shell command with body as stdin, return stdout.
+    On failure, return original body."""
+    import subprocess
+
     try:
         result = subprocess.run(
             cmd,
@@ -994,6 +1436,35 @@ def apply_post_process(body: bytes, cmd: str) -> bytes:
     return body
 
 
+def apply_post_process(body: bytes, cmd: str) -> bytes:
+    """Run shell command with body as stdin, return stdout. On failure, return original body."""
+    _gate_post_process(cmd)
+    return _run_post_process_cmd(body, cmd)
+
+
+def apply_post_process_many(results: list[BatchResult], cmd: str) -> None:
+    """Post-process the bodies of all successful results in place, in parallel.
+
+    The command is an external subprocess, so CPU-heavy filters (HTML
+    parsers, jq over large JSON) parallelize across cores by simply
+    keeping several subprocesses in flight; a thread per subprocess only
+    waits on its pipe. The gate/audit/warning runs once for the whole
+    batch rather than per item.
+    """
+    eligible = [r for r in results if r.body and not r.error and not r.skipped]
+    if not eligible:
+        return
+    _gate_post_process(cmd)
+    if len(eligible) == 1:
+        eligible[0].body = _run_post_process_cmd(eligible[0].body, cmd)
+        return
+    max_workers = min(len(eligible), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        bodies = pool.map(lambda r: _run_post_process_cmd(r.body, cmd), eligible)
+        for r, body in zip(eligible, bodies):
+            r.body = body
+
+
 def write_ndjson_line(
     result: BatchResult,
     fh: TextIO | None = None,
@@ -1065,7 +1536,11 @@ def write_ndjson_line(
     line = _json.dumps(obj, ensure_ascii=False)
     out: TextIO = fh if fh is not None else _sys.stdout
     out.write(line + "\n")
-    out.flush()
+    if fh is None:
+        # stdout may feed a pipeline (jq, tail -f) — keep it line-flushed.
+        # File output rides its buffer instead of paying a syscall per line;
+        # close() at the end of the batch flushes whatever remains.
+        out.flush()
 
 
 def write_batch_output_csv(
@@ -1197,17 +1672,46 @@ async def _run_api_batch_async(
     output_file: str | None = None,
     extract_field: str | None = None,
     fields: str | None = None,
+    hedge_after_ms: int = 0,
+    compress: str = "none",
+    cache_ttl: int = 0,
 ) -> None:
     _batch_start = time.monotonic()
     ndjson_pp = post_process if output_format == "ndjson" else None
     ndjson_fh = None
     if output_format == "ndjson" and output_file:
         try:
-            ndjson_fh = open(output_file, "w", encoding="utf-8")
+            # 1 MB buffer: lines accumulate in userspace and hit the disk in
+            # large sequential writes instead of one syscall per result.
+            ndjson_fh = open(output_file, "w", encoding="utf-8", buffering=1 << 20)
         except OSError as e:
             click.echo(f"Cannot write to '{output_file}': {e.strerror}", err=True)
             raise SystemExit(1)
 
+    # Individual-files mode streams each body to disk the moment it completes
+    # (then drops the reference), so a long batch never holds more than the
+    # in-flight bodies in memory. csv/update-csv modes still buffer: they need
+    # the full result set to build their single output file.
+    dir_writer: BatchDirWriter | None = None
+    if output_format is None and not update_csv_path:
+        dir_writer = BatchDirWriter(
+            output_dir, verbose, post_process=post_process, compress=compress
+        )
+
+    def _dir_callback(result: BatchResult) -> None:
+        assert dir_writer is not None
+        if result.body and not result.error and not result.skipped:
+            if fields:
+                from .cli_utils import _filter_fields
+
+                result.body = _filter_fields(result.body, fields)
+            if extract_field:
+                from .cli_utils import _extract_field_values
+
+                result.body = _extract_field_values(result.body, extract_field)
+        dir_writer.write_result(result)
+        result.body = b""  # release the body — it is on disk now
+
     def _ndjson_callback(result: BatchResult) -> None:
         if ndjson_pp and result.body and not result.error:
             body = apply_post_process(result.body, ndjson_pp)
@@ -1225,19 +1729,23 @@ async def _run_api_batch_async(
             )
         write_ndjson_line(result, fh=ndjson_fh, fields=fields)
 
-    async with Client(key, BASE_URL, connector_limit=concurrency) as client:
+    async with Client(key, BASE_URL, connector_limit=concurrency, cache_ttl=cache_ttl) as client:
 
         async def do_one(item: str):
             try:
                 data, headers, status_code = await api_call(client, item)
                 if status_code >= 400:
-                    err = RuntimeError(f"HTTP {status_code}")
-                    return data, headers, status_code, err, "json"
+                    return data, headers, status_code, http_status_error(status_code), "json"
                 return data, headers, status_code, None, "json"
             except Exception as e:
                 return b"", {}, 0, e, "json"
 
-        on_result_cb = _ndjson_callback if output_format == "ndjson" else None
+        if output_format == "ndjson":
+            on_result_cb: Callable[[BatchResult], None] | None = _ndjson_callback
+        elif dir_writer is not None:
+            on_result_cb = _dir_callback
+        else:
+            on_result_cb = None
         try:
             results = await run_batch_async(
                 inputs,
@@ -1247,21 +1755,23 @@ async def _run_api_batch_async(
                 skip_n=skip_n,
                 show_progress=show_progress,
                 on_result=on_result_cb,
+                hedge_after_ms=hedge_after_ms,
             )
         except BaseException:
             if ndjson_fh:
                 ndjson_fh.close()
             raise
 
-    # Apply fields filter to batch results (extract_field blocked by validation for csv/ndjson)
-    if fields:
+    # Apply fields filter to batch results (extract_field blocked by validation for csv/ndjson).
+    # The streaming directory path already applied both in _dir_callback.
+    if fields and dir_writer is None:
         from .cli_utils import _filter_fields
 
         for r in results:
             if r.body and not r.error and not r.skipped:
                 r.body = _filter_fields(r.body, fields)
 
-    if extract_field and not output_format:
+    if extract_field and not output_format and dir_writer is None:
         from .cli_utils import _extract_field_values
 
         for r in results:
@@ -1301,9 +1811,7 @@ async def _run_api_batch_async(
         )
     elif output_format == "csv":
         if post_process:
-            for r in results:
-                if r.body and not r.error and not r.skipped:
-                    r.body = apply_post_process(r.body, post_process)
+            apply_post_process_many(results, post_process)
         out_file_resolved, succeeded, failed = write_batch_output_csv(
             results, output_file, fields=fields
         )
@@ -1315,12 +1823,15 @@ async def _run_api_batch_async(
             output_path=out_file_resolved,
         )
     else:
-        out_dir_resolved, succeeded, failed = write_batch_output_to_dir(
-            results,
-            output_dir,
-            verbose,
-            post_process=post_process,
-        )
+        if dir_writer is not None:
+            out_dir_resolved, succeeded, failed = dir_writer.finalize()
+        else:
+            out_dir_resolved, succeeded, failed = write_batch_output_to_dir(
+                results,
+                output_dir,
+                verbose,
+                post_process=post_process,
+            )
         _batch_done(
             f"Batch complete: {succeeded} succeeded, {failed} failed. Output: {out_dir_resolved}",
             succeeded=succeeded,
@@ -1360,6 +1871,9 @@ def run_api_batch(
     output_file: str | None = None,
     extract_field: str | None = None,
     fields: str | None = None,
+    hedge_after_ms: int = 0,
+    compress: str = "none",
+    cache_ttl: int = 0,
 ) -> None:
     """Run a batch of single-item API calls and write results."""
     asyncio.run(
@@ -1381,5 +1895,8 @@ def run_api_batch(
             output_file=output_file,
             extract_field=extract_field,
             fields=fields,
+            hedge_after_ms=hedge_after_ms,
+            compress=compress,
+            cache_ttl=cache_ttl,
         )
     )
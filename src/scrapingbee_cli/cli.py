@@ -5,7 +5,7 @@ from __future__ import annotations
 import click
 
 from . import __version__
-from .commands import register_commands
+from .commands import COMMAND_MODULES, LazyGroup
 from .config import load_dotenv
 
 # Guard against REPL re-entry when cli.main(args) is called from within REPL
@@ -69,7 +69,7 @@ def _show_active_schedules_hint() -> None:
     )
 
 
-@click.group(invoke_without_command=True)
+@click.group(cls=LazyGroup, invoke_without_command=True)
 @click.version_option(version=__version__)
 @click.option(
     "--keep-bg",
@@ -103,6 +103,7 @@ def cli(ctx: click.Context, keep_bg: bool, classic_mouse: bool) -> None:
     if ctx.invoked_subcommand is None and not _in_repl:
         from .interactive import run_repl
 
+        cli.load_all()  # REPL completion/help introspect the full command tree
         _in_repl = True
         try:
             run_repl(cli, __version__, keep_bg=keep_bg, classic_mouse=classic_mouse)
@@ -110,9 +111,6 @@ def cli(ctx: click.Context, keep_bg: bool, classic_mouse: bool) -> None:
             _in_repl = False
 
 
-register_commands(cli)
-
-
 def _handle_resume() -> bool:
     """Handle `scrapingbee --resume` — list incomplete batches. Returns True if handled."""
     import sys
@@ -161,31 +159,8 @@ def _handle_scraping_config() -> None:
     if not args:
         return
     # Check if a subcommand is already specified before --scraping-config
-    # Known subcommands that could appear first
-    commands = {
-        "scrape",
-        "crawl",
-        "google",
-        "fast-search",
-        "amazon-product",
-        "amazon-pricing",
-        "amazon-search",
-        "walmart-search",
-        "walmart-product",
-        "youtube-search",
-        "youtube-metadata",
-        "chatgpt",
-        "gemini",
-        "usage",
-        "auth",
-        "logout",
-        "docs",
-        "schedule",
-        "export",
-        "unsafe",
-    }
     for a in args:
-        if a in commands:
+        if a in COMMAND_MODULES:
             return  # Subcommand already specified, let Click handle it
         if a == "--scraping-config":
             break  # --scraping-config comes before any subcommand
@@ -208,6 +183,12 @@ def main() -> None:
     try:
         from .cli_utils import collect_bool_flag_names, normalize_bool_flag_args
 
+        # Only the invoked subcommand's flags matter for normalization, so
+        # load just that module instead of materializing the whole tree.
+        for a in sys.argv[1:]:
+            if a in COMMAND_MODULES:
+                cli.get_command(None, a)
+                break
         _bool_flags = collect_bool_flag_names(cli)
         sys.argv[1:] = normalize_bool_flag_args(sys.argv[1:], _bool_flags)
     except Exception:
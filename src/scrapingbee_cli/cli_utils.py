@@ -357,10 +357,33 @@ def _batch_options(f: Any) -> Any:
         default=None,
         help="[Advanced] Batch: shell command to run after completion. Requires unsafe mode.",
     )(f)
+    f = click.option(
+        "--cache-ttl",
+        "cache_ttl",
+        type=int,
+        default=0,
+        help="Serve identical requests from a local response cache for N seconds "
+        "(0 = off). Cached hits cost no credits.",
+    )(f)
     f = click.option("--retries", type=int, default=3, help="Retry on errors (default: 3).")(f)
     f = click.option(
         "--backoff", type=float, default=2.0, help="Retry backoff multiplier (default: 2.0)."
     )(f)
+    f = click.option(
+        "--hedge-after-ms",
+        "hedge_after_ms",
+        type=int,
+        default=0,
+        help="Batch: duplicate a request still running after N ms and keep the first "
+        "reply (0 = off). Cuts tail latency; duplicates cost extra credits.",
+    )(f)
+    f = click.option(
+        "--compress",
+        "compress",
+        type=click.Choice(["none", "gzip"]),
+        default="none",
+        help="Batch: gzip each output file in --output-dir (saved as N.<ext>.gz).",
+    )(f)
     f = click.option(
         "--overwrite", is_flag=True, default=False, help="Overwrite output file without prompting."
     )(f)
@@ -500,6 +523,9 @@ def store_common_options(obj: dict, **kwargs: Any) -> None:
     obj["overwrite"] = kwargs.get("overwrite", False)
     obj["retries"] = kwargs.get("retries") if kwargs.get("retries") is not None else 3
     obj["backoff"] = kwargs.get("backoff") if kwargs.get("backoff") is not None else 2.0
+    obj["hedge_after_ms"] = max(0, kwargs.get("hedge_after_ms") or 0)
+    obj["compress"] = kwargs.get("compress") or "none"
+    obj["cache_ttl"] = max(0, kwargs.get("cache_ttl") or 0)
 
     # Validate flag combinations
     output_format = obj["output_format"]
@@ -1558,15 +1584,21 @@ def _validate_json_option(option_name: str, value: str | None) -> None:
         raise SystemExit(1)
 
 
+_TRUTHY = frozenset(("true", "1", "yes"))
+_FALSY = frozenset(("false", "0", "no"))
+
+
 def parse_bool(val: str | None) -> bool | None:
     """Parse a string to bool. None or empty -> None. Accepts true/1/yes -> True, false/0/no -> False.
     Raises ValueError for any other value so typos (e.g. treu) are not silently treated as False."""
+    if val is None:
+        return None
     if not val or not str(val).strip():
         return None
     v = str(val).strip().lower()
-    if v in ("true", "1", "yes"):
+    if v in _TRUTHY:
         return True
-    if v in ("false", "0", "no"):
+    if v in _FALSY:
         return False
     raise ValueError(f"Invalid boolean '{val}'. Use true/false, 1/0, or yes/no.")
 
@@ -1744,6 +1776,22 @@ def chunk_text(text: str, size: int, overlap: int = 0) -> list[str]:
     return [c for c in chunks if c]
 
 
+def get_header(headers: dict, name: str) -> str | None:
+    """Case-insensitive lookup of one response header.
+
+    Fast path: API headers arrive Title-Cased (``Spb-Cost``), so a single
+    ``.get`` usually hits; only oddly-cased headers pay the linear scan.
+    """
+    val = headers.get(name.title())
+    if val is not None:
+        return val
+    lname = name.lower()
+    for k, v in headers.items():
+        if k.lower() == lname:
+            return v
+    return None
+
+
 def _is_blocked(status_code: int, headers: dict) -> bool:
     """Check if the **target site** blocked the request (403/429).
 
@@ -1752,12 +1800,12 @@ def _is_blocked(status_code: int, headers: dict) -> bool:
     always in the ``spb-initial-status-code`` response header, regardless
     of ``--transparent-status-code``.
     """
-    for k, v in headers.items():
-        if k.lower() == "spb-initial-status-code":
-            try:
-                return int(v) in (403, 429)
-            except (ValueError, TypeError):
-                pass
+    v = get_header(headers, "spb-initial-status-code")
+    if v is not None:
+        try:
+            return int(v) in (403, 429)
+        except (ValueError, TypeError):
+            pass
     return False
 
 
@@ -1801,11 +1849,7 @@ async def scrape_with_escalation(
         escalated = {**scrape_kwargs, **tier_overrides}
         data, headers, status_code = await client.scrape(url, **escalated)
         if verbose:
-            cost = None
-            for k, v in headers.items():
-                if k.lower() == "spb-cost":
-                    cost = v
-                    break
+            cost = get_header(headers, "spb-cost")
             cost_str = f" ({cost} credits)" if cost else ""
             click.echo(f"[escalate-proxy] {tier_name} → HTTP {status_code}{cost_str}", err=True)
         if not _is_blocked(status_code, headers):
@@ -1831,6 +1875,16 @@ def prepare_batch_inputs(inputs: list[str], obj: dict) -> list[str]:
             click.echo(
                 f"Deduplicated: removed {removed} duplicate(s), {len(inputs)} unique", err=True
             )
+    else:
+        # Exact-string check only (no URL normalization) — cheap enough to run
+        # on every batch, and each duplicate dispatched costs real credits.
+        dup_count = len(inputs) - len(set(inputs))
+        if dup_count:
+            click.echo(
+                f"Note: input contains {dup_count} duplicate item(s); "
+                "pass --deduplicate to fetch each only once.",
+                err=True,
+            )
     sample_n = obj.get("sample", 0)
     if sample_n > 0:
         inputs = sample_inputs(inputs, sample_n)
@@ -1838,6 +1892,74 @@ def prepare_batch_inputs(inputs: list[str], obj: dict) -> list[str]:
     return inputs
 
 
+def require_api_key(flag_value: str | None = None) -> str:
+    """get_api_key() with the standard CLI error handling (echo + exit 1)."""
+    from .config import get_api_key
+
+    try:
+        return get_api_key(flag_value)
+    except ValueError as e:
+        click.echo(str(e), err=True)
+        raise SystemExit(1)
+
+
+def run_batch_command(obj: dict, key: str, input_file: str, api_call: Any) -> None:
+    """Shared ``--input-file`` pipeline for the single-item API commands.
+
+    read inputs → dedupe/sample → usage check → concurrency resolution →
+    resume skip-set → run_api_batch. Commands supply only the ``api_call``
+    closure with their pre-validated, invocation-invariant kwargs, so perf
+    work on the pipeline (streaming, session reuse, ...) lands in one place.
+    """
+    from .batch import (
+        _find_completed_n,
+        get_batch_usage,
+        read_input_file,
+        resolve_batch_concurrency,
+        run_api_batch,
+        validate_batch_run,
+    )
+
+    try:
+        inputs = read_input_file(input_file, input_column=obj.get("input_column"))
+    except ValueError as e:
+        click.echo(str(e), err=True)
+        raise SystemExit(1)
+    inputs = prepare_batch_inputs(inputs, obj)
+    usage_info = get_batch_usage(None)
+    try:
+        validate_batch_run(obj["concurrency"], len(inputs), usage_info)
+    except ValueError as e:
+        click.echo(str(e), err=True)
+        raise SystemExit(1)
+    concurrency = resolve_batch_concurrency(obj["concurrency"], usage_info, len(inputs))
+
+    skip_n = _find_completed_n(obj.get("output_dir") or "") if obj.get("resume") else frozenset()
+
+    run_api_batch(
+        key=key,
+        inputs=inputs,
+        concurrency=concurrency,
+        from_user=obj["concurrency"] > 0,
+        skip_n=skip_n,
+        output_dir=obj.get("output_dir") or None,
+        verbose=obj["verbose"],
+        show_progress=obj.get("progress", True),
+        api_call=api_call,
+        on_complete=obj.get("on_complete"),
+        output_format=obj.get("output_format"),
+        post_process=obj.get("post_process"),
+        update_csv_path=input_file if obj.get("update_csv") else None,
+        input_column=obj.get("input_column"),
+        output_file=obj.get("output_file") or None,
+        extract_field=obj.get("extract_field"),
+        fields=obj.get("fields"),
+        hedge_after_ms=obj.get("hedge_after_ms", 0),
+        compress=obj.get("compress", "none"),
+        cache_ttl=obj.get("cache_ttl", 0),
+    )
+
+
 def run_on_complete(
     cmd: str | None,
     *,
@@ -1874,6 +1996,15 @@ def run_on_complete(
         click.echo(f"[on-complete] Exit code: {result.returncode}", err=True)
 
 
+# (header-key, display-label) pairs for the verbose response summary.
+_VERBOSE_HEADER_LABELS = (
+    ("spb-cost", "Credit Cost"),
+    ("spb-resolved-url", "Resolved URL"),
+    ("spb-initial-status-code", "Initial Status Code"),
+    ("tag", "Tag"),
+)
+
+
 def write_output(
     data: bytes,
     headers: dict,
@@ -1907,12 +2038,7 @@ def write_output(
             styled_echo(f"HTTP Status: {status_code}", style=status_style)
             headers_lower = {k.lower(): (k, v) for k, v in headers.items()}
             spb_cost_present = False
-            for key, label in [
-                ("spb-cost", "Credit Cost"),
-                ("spb-resolved-url", "Resolved URL"),
-                ("spb-initial-status-code", "Initial Status Code"),
-                ("tag", "Tag"),
-            ]:
+            for key, label in _VERBOSE_HEADER_LABELS:
                 if key in headers_lower:
                     _, val = headers_lower[key]
                     if val:
@@ -1929,32 +2055,29 @@ def write_output(
                         echo_key_value("Credit Cost (estimated)", str(ESTIMATED_CREDITS[command]))
             echo_separator()
         else:
-            click.echo(f"HTTP Status: {status_code}", err=True)
+            # Assemble the block and emit it as one echo — a single stderr
+            # write/flush instead of up to seven, which adds up on verbose
+            # batches.
+            lines = [f"HTTP Status: {status_code}"]
             headers_lower = {k.lower(): (k, v) for k, v in headers.items()}
             spb_cost_present = False
-            for key, label in [
-                ("spb-cost", "Credit Cost"),
-                ("spb-resolved-url", "Resolved URL"),
-                ("spb-initial-status-code", "Initial Status Code"),
-                ("tag", "Tag"),
-            ]:
+            for key, label in _VERBOSE_HEADER_LABELS:
                 if key in headers_lower:
                     _, val = headers_lower[key]
                     if val:
-                        click.echo(f"{label}: {val}", err=True)
+                        lines.append(f"{label}: {val}")
                         if key == "spb-cost":
                             spb_cost_present = True
             if not spb_cost_present:
                 if credit_cost is not None:
-                    click.echo(f"Credit Cost: {credit_cost}", err=True)
+                    lines.append(f"Credit Cost: {credit_cost}")
                 elif command:
                     from scrapingbee_cli.credits import ESTIMATED_CREDITS
 
                     if command in ESTIMATED_CREDITS:
-                        click.echo(
-                            f"Credit Cost (estimated): {ESTIMATED_CREDITS[command]}", err=True
-                        )
-            click.echo("---", err=True)
+                        lines.append(f"Credit Cost (estimated): {ESTIMATED_CREDITS[command]}")
+            lines.append("---")
+            click.echo("\n".join(lines), err=True)
     if smart_extract:
         from .extract import smart_extract as _smart_extract_fn
 
@@ -1974,13 +2097,22 @@ def write_output(
                 raise SystemExit(1)
         if not skip_overwrite_check:
             confirm_overwrite(resolved, overwrite)
+        import os
+
+        # os.open/os.write skips the BufferedWriter user-space copy — the body
+        # is already one bytes object. Unlike batch's _write_file_bytes we do
+        # not drop the page cache: a single output is often opened right away.
         try:
-            fh = open(resolved, "wb")
+            fd = os.open(resolved, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
         except OSError as e:
             click.echo(f"Cannot write to '{resolved}': {e.strerror}", err=True)
             raise SystemExit(1)
-        with fh:
-            fh.write(data)
+        try:
+            view = memoryview(data)
+            while len(view):
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
         # Confirm the save with the path — both as feedback (M1: success was
         # otherwise silent) and so the REPL auto-linkifies it (click-to-open
         # only works on paths printed to the scrollback). stderr keeps
@@ -1995,12 +2127,13 @@ def write_output(
         # a path to the full output. Non-REPL invocations (`scrapingbee scrape ...`)
         # keep the original behaviour so pipes and redirects work unchanged.
         preview_data, repl_summary, repl_full_path = _maybe_repl_preview(data)
-        sys.stdout.buffer.write(preview_data)
         # Only add a trailing newline for text-like content; binary data (PNG, PDF, etc.)
-        # must not have extra bytes appended.
-        if preview_data and not preview_data.endswith(b"\n"):
-            if _is_text_payload(preview_data):
-                click.echo()
+        # must not have extra bytes appended. Folding the newline into the same
+        # write keeps it to one flush instead of a write plus a click.echo().
+        if preview_data and preview_data[-1:] != b"\n" and _is_text_payload(preview_data):
+            preview_data += b"\n"
+        sys.stdout.buffer.write(preview_data)
+        sys.stdout.buffer.flush()
         if repl_summary:
             from .theme import BEE_DIM, BEE_YELLOW, err_console
 
@@ -3,12 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
+import os
 import ssl
+import time
+from pathlib import Path
 from typing import Any
+from urllib.parse import quote_plus, urlencode
 
 import aiohttp
 import certifi
+from yarl import URL
 
 from . import user_agent_headers
 from .config import BASE_URL
@@ -19,6 +25,118 @@ def _clean_params(params: dict) -> dict:
     return {k: v for k, v in params.items() if v is not None and v != ""}
 
 
+def _retry_delay(headers: dict, status: int, fallback: float) -> float:
+    """Backoff delay for one retry attempt, honouring Retry-After on 429/503.
+
+    The header's seconds form is used when present and sane (capped at 60s so
+    a misbehaving proxy cannot stall the CLI); the HTTP-date form and anything
+    unparseable fall back to the exponential delay.
+    """
+    if status in (429, 503):
+        raw = headers.get("Retry-After") or headers.get("retry-after")
+        if raw is not None:
+            try:
+                seconds = float(raw)
+            except (TypeError, ValueError):
+                return fallback
+            if seconds > 0:
+                return min(seconds, 60.0)
+    return fallback
+
+
+# ── Response cache ───────────────────────────────────────────────────────────
+# Opt-in (--cache-ttl): repeated identical GETs during iterative work return
+# the saved body instead of spending seconds of latency and paid credits.
+# Same defensive style as the usage cache in batch.py — any cache failure
+# silently falls through to the network.
+
+
+def _response_cache_dir() -> Path:
+    """Cache directory — respects SCRAPINGBEE_RESPONSE_CACHE_DIR for test isolation."""
+    override = os.environ.get("SCRAPINGBEE_RESPONSE_CACHE_DIR")
+    if override:
+        return Path(override)
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg) if xdg else Path.home() / ".cache"
+    return base / "scrapingbee-cli" / "responses"
+
+
+def response_cache_key(path: str, params: dict, headers: dict | None = None) -> str:
+    """Deterministic key for a GET — the api_key never participates.
+
+    Forwarded request headers do: a response fetched with one Cookie must not
+    be replayed for a run that sends another (or none).
+    """
+    material = json.dumps(
+        [
+            path,
+            sorted((k, str(v)) for k, v in params.items() if k != "api_key"),
+            sorted((k, str(v)) for k, v in (headers or {}).items()),
+        ]
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:32]
+
+
+def read_response_cache(key: str, ttl: int) -> tuple[bytes, dict, int] | None:
+    """Return a cached (body, headers, status) if fresh, else None."""
+    try:
+        base = _response_cache_dir()
+        meta_raw = (base / f"{key}.json").read_text(encoding="utf-8")
+        meta = json.loads(meta_raw)
+        if time.time() - float(meta["ts"]) > ttl:
+            # Stale entries are dead weight — drop them on sight so repeated
+            # runs with short TTLs don't accumulate files forever.
+            (base / f"{key}.json").unlink(missing_ok=True)
+            (base / f"{key}.bin").unlink(missing_ok=True)
+            return None
+        body = (base / f"{key}.bin").read_bytes()
+        return body, dict(meta.get("headers") or {}), int(meta["status"])
+    except Exception:
+        return None
+
+
+#: Hard ceiling on cached responses; the oldest beyond it are pruned on write.
+_CACHE_MAX_ENTRIES = 512
+
+
+def _prune_response_cache(base: Path) -> None:
+    """Evict the oldest entries once the cache outgrows _CACHE_MAX_ENTRIES."""
+    metas = sorted(base.glob("*.json"), key=lambda p: p.stat().st_mtime)
+    for meta in metas[: max(0, len(metas) - _CACHE_MAX_ENTRIES)]:
+        meta.unlink(missing_ok=True)
+        meta.with_suffix(".bin").unlink(missing_ok=True)
+
+
+def write_response_cache(key: str, body: bytes, headers: dict, status: int) -> None:
+    """Persist one GET response; errors are swallowed (cache is best-effort)."""
+    try:
+        base = _response_cache_dir()
+        base.mkdir(parents=True, exist_ok=True)
+        (base / f"{key}.bin").write_bytes(body)
+        meta = {"ts": time.time(), "status": status, "headers": dict(headers)}
+        (base / f"{key}.json").write_text(json.dumps(meta), encoding="utf-8")
+        _prune_response_cache(base)
+    except Exception:
+        pass
+
+
+_ssl_context: ssl.SSLContext | None = None
+
+
+def _shared_ssl_context() -> ssl.SSLContext:
+    """Return the process-wide SSL context, building it on first use.
+
+    Creating a default context loads the whole certifi CA bundle from disk;
+    a CLI invocation constructs several Clients (usage pre-flight, batch,
+    REPL commands), and sharing one context both skips the repeated bundle
+    load and lets OpenSSL resume TLS sessions across those clients.
+    """
+    global _ssl_context
+    if _ssl_context is None:
+        _ssl_context = ssl.create_default_context(cafile=certifi.where())
+    return _ssl_context
+
+
 class Client:
     """ScrapingBee API client (async, use as context manager)."""
 
@@ -28,20 +146,36 @@ class Client:
         base_url: str = BASE_URL,
         timeout: int = 150,
         connector_limit: int | None = None,
+        cache_ttl: int = 0,
     ):
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self._connector_limit = connector_limit
+        # Seconds a cached GET response stays valid; 0 disables the cache.
+        self.cache_ttl = cache_ttl
         self._session: aiohttp.ClientSession | None = None
 
     async def __aenter__(self) -> Client:
-        ssl_context = ssl.create_default_context(cafile=certifi.where())
-        connector = (
-            aiohttp.TCPConnector(limit=self._connector_limit, ssl=ssl_context)
-            if self._connector_limit is not None
-            else aiohttp.TCPConnector(ssl=ssl_context)
-        )
+        ssl_context = _shared_ssl_context()
+        # Keep-alive sockets and a long DNS TTL make every request after the
+        # first skip the TCP+TLS handshake and resolver round-trip — the batch
+        # paths reuse this one session for the whole run.
+        #
+        # HTTP/1.1 keep-alive (not HTTP/2 multiplexing) is deliberate: aiohttp
+        # has no h2 support, so HTTP/2 would mean swapping the transport to
+        # httpx and losing the connector tuning here. With keep-alive the
+        # handshake cost is already amortized to one per pooled socket per
+        # batch; multiplexing would only shrink the socket count, not the
+        # request latency. Revisit if the API ever prefers h2.
+        connector_kwargs: dict[str, Any] = {
+            "ssl": ssl_context,
+            "ttl_dns_cache": 300,
+            "keepalive_timeout": 60,
+        }
+        if self._connector_limit is not None:
+            connector_kwargs["limit"] = self._connector_limit
+        connector = aiohttp.TCPConnector(**connector_kwargs)
         timeout = aiohttp.ClientTimeout(total=self.timeout)
         self._session = aiohttp.ClientSession(
             connector=connector,
@@ -67,10 +201,33 @@ class Client:
         headers: dict[str, str] | None = None,
     ) -> tuple[bytes, dict, int]:
         params = _clean_params(params)
+        cache_key = None
+        if self.cache_ttl > 0:
+            cache_key = response_cache_key(path, params, headers)
+            cached = read_response_cache(cache_key, self.cache_ttl)
+            if cached is not None:
+                return cached
         params.setdefault("api_key", self.api_key)
         url = f"{self.base_url}{path}" if path else self.base_url
         session = self._ensure_session()
         req_kwargs: dict[str, Any] = {"params": params}
+        if headers:
+            req_kwargs["headers"] = headers
+        async with session.get(url, **req_kwargs) as resp:
+            body = await resp.read()
+            out_headers = dict(resp.headers)
+            if cache_key is not None and 200 <= resp.status < 300:
+                write_response_cache(cache_key, body, out_headers, resp.status)
+            return body, out_headers, resp.status
+
+    async def _get_url(
+        self,
+        url: URL,
+        headers: dict[str, str] | None = None,
+    ) -> tuple[bytes, dict, int]:
+        """GET a fully built, already percent-encoded URL (no param encoding)."""
+        session = self._ensure_session()
+        req_kwargs: dict[str, Any] = {}
         if headers:
             req_kwargs["headers"] = headers
         async with session.get(url, **req_kwargs) as resp:
@@ -86,20 +243,22 @@ class Client:
         retries: int = 3,
         backoff: float = 2.0,
     ) -> tuple[bytes, dict, int]:
-        """GET with optional retries on 5xx or connection/timeout errors."""
+        """GET with optional retries on 429/5xx or connection/timeout errors."""
         last_error: BaseException | None = None
         last_result: tuple[bytes, dict, int] = (b"", {}, 500)
         for attempt in range(max(0, retries) + 1):
+            delay = backoff**attempt
             try:
                 body_out, out_headers, status = await self._get(path, params, headers=headers)
                 last_result = (body_out, out_headers, status)
-                if status < 500 or attempt >= max(0, retries):
+                if (status < 500 and status != 429) or attempt >= max(0, retries):
                     return body_out, out_headers, status
+                delay = _retry_delay(out_headers, status, delay)
                 last_error = None
             except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 last_error = e
             if attempt < max(0, retries):
-                await asyncio.sleep(backoff**attempt)
+                await asyncio.sleep(delay)
         if last_error is not None:
             raise last_error
         return last_result
@@ -139,9 +298,9 @@ class Client:
             return None
         return "true" if val else "false"
 
-    async def scrape(
-        self,
-        url: str,
+    @classmethod
+    def build_scrape_params(
+        cls,
         method: str = "GET",
         render_js: bool | None = None,
         js_scenario: str | None = None,
@@ -158,7 +317,6 @@ class Client:
         own_proxy: str | None = None,
         forward_headers: bool | None = None,
         forward_headers_pure: bool | None = None,
-        custom_headers: dict[str, str] | None = None,
         json_response: bool | None = None,
         screenshot: bool | None = None,
         screenshot_selector: str | None = None,
@@ -177,38 +335,42 @@ class Client:
         custom_google: bool | None = None,
         transparent_status_code: bool | None = None,
         tag: str | None = None,
-        body: str | None = None,
         scraping_config: str | None = None,
-        retries: int = 3,
-        backoff: float = 2.0,
         **kwargs: Any,
-    ) -> tuple[bytes, dict, int]:
-        params = {"url": url}
+    ) -> dict[str, str]:
+        """Build the url-independent query params for :meth:`scrape`.
+
+        Pure and invocation-invariant: batch callers can build this dict once
+        and pass it as ``base_params`` so the None-filtering and bool/str
+        conversion below run once per batch instead of once per URL.
+        Extra kwargs (retries, backoff, custom_headers, body) are ignored.
+        """
+        params: dict[str, str] = {}
         if method and method.upper() != "GET":
             params["method"] = method.upper()
         for k, v in [
-            ("render_js", self._bool(render_js)),
+            ("render_js", cls._bool(render_js)),
             ("js_scenario", js_scenario),
             ("wait", wait if wait is not None else None),
             ("wait_for", wait_for),
             ("wait_browser", wait_browser),
-            ("block_ads", self._bool(block_ads)),
-            ("block_resources", self._bool(block_resources)),
+            ("block_ads", cls._bool(block_ads)),
+            ("block_resources", cls._bool(block_resources)),
             ("window_width", window_width if window_width is not None else None),
             ("window_height", window_height if window_height is not None else None),
-            ("premium_proxy", self._bool(premium_proxy)),
-            ("stealth_proxy", self._bool(stealth_proxy)),
+            ("premium_proxy", cls._bool(premium_proxy)),
+            ("stealth_proxy", cls._bool(stealth_proxy)),
             ("country_code", country_code),
             ("own_proxy", own_proxy),
-            ("forward_headers", self._bool(forward_headers)),
-            ("forward_headers_pure", self._bool(forward_headers_pure)),
-            ("json_response", self._bool(json_response)),
-            ("screenshot", self._bool(screenshot)),
+            ("forward_headers", cls._bool(forward_headers)),
+            ("forward_headers_pure", cls._bool(forward_headers_pure)),
+            ("json_response", cls._bool(json_response)),
+            ("screenshot", cls._bool(screenshot)),
             ("screenshot_selector", screenshot_selector),
-            ("screenshot_full_page", self._bool(screenshot_full_page)),
-            ("return_page_source", self._bool(return_page_source)),
-            ("return_page_markdown", self._bool(return_page_markdown)),
-            ("return_page_text", self._bool(return_page_text)),
+            ("screenshot_full_page", cls._bool(screenshot_full_page)),
+            ("return_page_source", cls._bool(return_page_source)),
+            ("return_page_markdown", cls._bool(return_page_markdown)),
+            ("return_page_text", cls._bool(return_page_text)),
             ("extract_rules", extract_rules),
             ("ai_query", ai_query),
             ("ai_selector", ai_selector),
@@ -217,16 +379,117 @@ class Client:
             ("timeout", timeout if timeout is not None else None),
             ("cookies", cookies),
             ("device", device),
-            ("custom_google", self._bool(custom_google)),
-            ("transparent_status_code", self._bool(transparent_status_code)),
+            ("custom_google", cls._bool(custom_google)),
+            ("transparent_status_code", cls._bool(transparent_status_code)),
             ("tag", tag),
             ("scraping_config", scraping_config),
         ]:
             if v is not None:
                 params[k] = str(v) if not isinstance(v, str) else v
+        return params
+
+    @classmethod
+    def encode_scrape_query(cls, base_params: dict[str, str]) -> str:
+        """Percent-encode the url-independent scrape params once.
+
+        Batch runs pass the same ~25 static params for every URL; encoding
+        them up front and handing the string to :meth:`scrape` as
+        ``base_query`` skips yarl's per-request query encoding on the hot
+        path. Only used for GET — POST keeps the params-dict path.
+        """
+        return urlencode(_clean_params(base_params))
+
+    async def scrape(
+        self,
+        url: str,
+        method: str = "GET",
+        render_js: bool | None = None,
+        js_scenario: str | None = None,
+        wait: int | None = None,
+        wait_for: str | None = None,
+        wait_browser: str | None = None,
+        block_ads: bool | None = None,
+        block_resources: bool | None = None,
+        window_width: int | None = None,
+        window_height: int | None = None,
+        premium_proxy: bool | None = None,
+        stealth_proxy: bool | None = None,
+        country_code: str | None = None,
+        own_proxy: str | None = None,
+        forward_headers: bool | None = None,
+        forward_headers_pure: bool | None = None,
+        custom_headers: dict[str, str] | None = None,
+        json_response: bool | None = None,
+        screenshot: bool | None = None,
+        screenshot_selector: str | None = None,
+        screenshot_full_page: bool | None = None,
+        return_page_source: bool | None = None,
+        return_page_markdown: bool | None = None,
+        return_page_text: bool | None = None,
+        extract_rules: str | None = None,
+        ai_query: str | None = None,
+        ai_selector: str | None = None,
+        ai_extract_rules: str | None = None,
+        session_id: int | None = None,
+        timeout: int | None = None,
+        cookies: str | None = None,
+        device: str | None = None,
+        custom_google: bool | None = None,
+        transparent_status_code: bool | None = None,
+        tag: str | None = None,
+        body: str | None = None,
+        scraping_config: str | None = None,
+        retries: int = 3,
+        backoff: float = 2.0,
+        base_params: dict[str, str] | None = None,
+        base_query: str | None = None,
+        base_headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> tuple[bytes, dict, int]:
+        if base_params is None:
+            base_params = self.build_scrape_params(
+                method=method,
+                render_js=render_js,
+                js_scenario=js_scenario,
+                wait=wait,
+                wait_for=wait_for,
+                wait_browser=wait_browser,
+                block_ads=block_ads,
+                block_resources=block_resources,
+                window_width=window_width,
+                window_height=window_height,
+                premium_proxy=premium_proxy,
+                stealth_proxy=stealth_proxy,
+                country_code=country_code,
+                own_proxy=own_proxy,
+                forward_headers=forward_headers,
+                forward_headers_pure=forward_headers_pure,
+                json_response=json_response,
+                screenshot=screenshot,
+                screenshot_selector=screenshot_selector,
+                screenshot_full_page=screenshot_full_page,
+                return_page_source=return_page_source,
+                return_page_markdown=return_page_markdown,
+                return_page_text=return_page_text,
+                extract_rules=extract_rules,
+                ai_query=ai_query,
+                ai_selector=ai_selector,
+                ai_extract_rules=ai_extract_rules,
+                session_id=session_id,
+                timeout=timeout,
+                cookies=cookies,
+                device=device,
+                custom_google=custom_google,
+                transparent_status_code=transparent_status_code,
+                tag=tag,
+                scraping_config=scraping_config,
+            )
+        params = {"url": url, **base_params}
         method_upper = (method or "GET").upper()
-        req_headers: dict[str, str] | None = None
-        if custom_headers:
+        # base_headers mirrors base_params: batch callers derive the request
+        # headers (Spb- prefixing for GET) once and reuse them per item.
+        req_headers: dict[str, str] | None = base_headers
+        if req_headers is None and custom_headers:
             if method_upper == "GET":
                 req_headers = {f"Spb-{k}": v for k, v in custom_headers.items()}
             else:
@@ -234,12 +497,21 @@ class Client:
         last_error: BaseException | None = None
         last_result: tuple[bytes, dict, int] = (b"", {}, 500)
         for attempt in range(max(0, retries) + 1):
+            delay = backoff**attempt
             try:
-                if method_upper == "GET":
+                if method_upper == "GET" and base_query is not None:
+                    # Pre-encoded batch path (see encode_scrape_query): only the
+                    # api_key and the per-item url still need quoting.
+                    prefix = f"{base_query}&" if base_query else ""
+                    target = URL(
+                        f"{self.base_url}?{prefix}api_key={quote_plus(self.api_key)}"
+                        f"&url={quote_plus(url)}",
+                        encoded=True,
+                    )
+                    body_out, out_headers, status = await self._get_url(target, headers=req_headers)
+                elif method_upper == "GET":
                     body_out, out_headers, status = await self._get("", params, headers=req_headers)
                 else:
-                    params_clean = _clean_params(params)
-                    params_clean["api_key"] = self.api_key
                     # ScrapingBee API expects POST to it as application/x-www-form-urlencoded
                     content_type = "application/x-www-form-urlencoded; charset=utf-8"
                     # Don't send user's Content-Type to ScrapingBee; forward via params if needed
@@ -248,22 +520,29 @@ class Client:
                         if req_headers
                         else None
                     )
+                    # _request None-filters and injects the api_key itself —
+                    # no need to pre-clean here.
                     body_out, out_headers, status = await self._request(
                         method_upper,
                         "",
-                        params_clean,
+                        params,
                         data=body,
                         content_type=content_type,
                         headers=req_headers_send,
                     )
                 last_result = (body_out, out_headers, status)
-                if status < 500 or attempt >= max(0, retries):
+                # 429 is retryable API backpressure — but not when the caller
+                # asked for transparent status codes, where it may be the
+                # target site's own response and each retry costs credits.
+                retry_429 = status == 429 and base_params.get("transparent_status_code") != "true"
+                if (status < 500 and not retry_429) or attempt >= max(0, retries):
                     return body_out, out_headers, status
+                delay = _retry_delay(out_headers, status, delay)
                 last_error = None
             except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 last_error = e
             if attempt < max(0, retries):
-                await asyncio.sleep(backoff**attempt)
+                await asyncio.sleep(delay)
         if last_error is not None:
             raise last_error
         return last_result
@@ -660,6 +939,24 @@ class Client:
         )
 
 
+# Fallback key names for parse_usage, ordered by how likely each is to appear;
+# hoisted to module scope so the tuples are built once, not per call.
+_CONCURRENCY_FALLBACK_KEYS = (
+    "max_concurrent_requests",
+    "concurrent_request_limit",
+    "concurrency",
+    "concurrent_requests",
+)
+_CREDIT_FALLBACK_KEYS = (
+    "credits",
+    "available_credits",
+    "credit_balance",
+    "balance",
+    "credits_remaining",
+    "remaining_credits",
+)
+
+
 def parse_usage(body: bytes) -> dict:
     """Extract max_concurrency and credits from usage API response.
 
@@ -691,25 +988,13 @@ def parse_usage(body: bytes) -> dict:
     # These exist because the API contract has drifted over time; the canonical
     # keys (max_api_credit / used_api_credit / max_concurrency) are tried first.
     if out["max_concurrency"] == 5:
-        for key in (
-            "max_concurrent_requests",
-            "concurrent_request_limit",
-            "concurrency",
-            "concurrent_requests",
-        ):
+        for key in _CONCURRENCY_FALLBACK_KEYS:
             value = data.get(key)
             if value is not None and isinstance(value, (int, float)) and 0 < value <= 10000:
                 out["max_concurrency"] = int(value)
                 break
     if out["credits"] == 0:
-        for key in (
-            "credits",
-            "available_credits",
-            "credit_balance",
-            "balance",
-            "credits_remaining",
-            "remaining_credits",
-        ):
+        for key in _CREDIT_FALLBACK_KEYS:
             value = data.get(key)
             if value is not None and isinstance(value, (int, float)) and value >= 0:
                 out["credits"] = int(value)
@@ -719,6 +1004,11 @@ def parse_usage(body: bytes) -> dict:
 
 def pretty_json(data: bytes) -> str:
     """Pretty-print JSON or return raw string."""
+    # A JSON document starts with { or [ — anything else (HTML, PNG bytes)
+    # skips the O(N) parse attempt and decodes straight away.
+    head = data[:16].lstrip(b" \t\r\n")
+    if not head or head[:1] not in (b"{", b"["):
+        return data.decode("utf-8", errors="replace")
     try:
         obj = json.loads(data)
         return json.dumps(obj, indent=2)
@@ -1,44 +1,63 @@
-"""CLI command modules. Register all commands with the main cli group."""
+"""CLI command modules, registered lazily with the main cli group."""
 
 from __future__ import annotations
 
+import importlib
+
 import click
 
+# Static command-name → module map. Keep in sync with each module's
+# ``register()``; a module may register several sibling commands
+# (e.g. auth also adds docs/logout), so names can share a module.
+COMMAND_MODULES: dict[str, str] = {
+    "usage": "usage",
+    "auth": "auth",
+    "docs": "auth",
+    "logout": "auth",
+    "scrape": "scrape",
+    "crawl": "crawl",
+    "google": "google",
+    "fast-search": "fast_search",
+    "amazon-product": "amazon",
+    "amazon-pricing": "amazon",
+    "amazon-search": "amazon",
+    "walmart-search": "walmart",
+    "walmart-product": "walmart",
+    "youtube-search": "youtube",
+    "youtube-metadata": "youtube",
+    "chatgpt": "chatgpt",
+    "gemini": "gemini",
+    "export": "export",
+    "tutorial": "tutorial",
+    "schedule": "schedule",
+    "unsafe": "unsafe",
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports command modules on first use.
+
+    Constructing the full option table (~240 click.Option objects across
+    18 commands) dominates CLI cold-start; a one-shot invocation like
+    ``scrapingbee usage`` only needs its own module. The REPL calls
+    :meth:`load_all` up front so tab-completion and help still see every
+    command.
+    """
+
+    def list_commands(self, ctx: click.Context | None) -> list[str]:
+        return sorted(set(self.commands) | set(COMMAND_MODULES))
+
+    def get_command(self, ctx: click.Context | None, cmd_name: str) -> click.Command | None:
+        cmd = self.commands.get(cmd_name)
+        if cmd is not None:
+            return cmd
+        module = COMMAND_MODULES.get(cmd_name)
+        if module is None:
+            return None
+        importlib.import_module(f".{module}", __name__).register(self)
+        return self.commands.get(cmd_name)
 
-def register_commands(cli: click.Group) -> None:
-    """Register all subcommands with the main cli group."""
-    from . import (
-        amazon,
-        auth,
-        chatgpt,
-        crawl,
-        export,
-        fast_search,
-        gemini,
-        google,
-        schedule,
-        tutorial,
-        usage,
-        walmart,
-        youtube,
-    )
-
-    usage.register(cli)
-    auth.register(cli)
-    from . import scrape
-
-    scrape.register(cli)
-    crawl.register(cli)
-    google.register(cli)
-    fast_search.register(cli)
-    amazon.register(cli)
-    walmart.register(cli)
-    youtube.register(cli)
-    chatgpt.register(cli)
-    gemini.register(cli)
-    export.register(cli)
-    tutorial.register(cli)
-    schedule.register(cli)
-    from . import unsafe
-
-    unsafe.register(cli)
+    def load_all(self) -> None:
+        """Materialize every command (used by the REPL before introspection)."""
+        for name in COMMAND_MODULES:
+            self.get_command(None, name)
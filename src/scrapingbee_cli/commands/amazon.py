@@ -7,14 +7,6 @@ import asyncio
 import click
 from click_option_group import optgroup
 
-from ..batch import (
-    _find_completed_n,
-    get_batch_usage,
-    read_input_file,
-    resolve_batch_concurrency,
-    run_api_batch,
-    validate_batch_run,
-)
 from ..cli_utils import (
     BOOL_STR,
     DEVICE_DESKTOP_MOBILE_TABLET,
@@ -24,12 +16,13 @@ from ..cli_utils import (
     check_api_response,
     norm_val,
     parse_bool,
-    prepare_batch_inputs,
+    require_api_key,
+    run_batch_command,
     store_common_options,
     write_output,
 )
 from ..client import Client
-from ..config import BASE_URL, get_api_key
+from ..config import BASE_URL
 
 AMAZON_SORT_BY = [
     "most-recent",
@@ -98,70 +91,32 @@ def amazon_product_cmd(
     if not input_file and not asin:
         click.echo("expected one ASIN, or use --input-file for batch", err=True)
         raise SystemExit(1)
-    try:
-        key = get_api_key(None)
-    except ValueError as e:
-        click.echo(str(e), err=True)
-        raise SystemExit(1)
+    key = require_api_key()
 
     if input_file:
         if asin:
             click.echo("cannot use both --input-file and positional ASIN", err=True)
             raise SystemExit(1)
-        try:
-            inputs = read_input_file(input_file, input_column=obj.get("input_column"))
-        except ValueError as e:
-            click.echo(str(e), err=True)
-            raise SystemExit(1)
-        inputs = prepare_batch_inputs(inputs, obj)
-        usage_info = get_batch_usage(None)
-        try:
-            validate_batch_run(obj["concurrency"], len(inputs), usage_info)
-        except ValueError as e:
-            click.echo(str(e), err=True)
-            raise SystemExit(1)
-        concurrency = resolve_batch_concurrency(obj["concurrency"], usage_info, len(inputs))
-
-        skip_n = (
-            _find_completed_n(obj.get("output_dir") or "") if obj.get("resume") else frozenset()
+        # Invocation-invariant kwargs built once, not per batch item.
+        call_kwargs = dict(
+            device=device,
+            domain=domain,
+            country=country,
+            zip_code=zip_code,
+            language=language,
+            currency=currency,
+            add_html=parse_bool(add_html),
+            light_request=parse_bool(light_request),
+            screenshot=parse_bool(screenshot),
+            tag=tag,
+            retries=int(obj.get("retries") or 3),
+            backoff=float(obj.get("backoff") or 2.0),
         )
 
         async def api_call(client, a):
-            return await client.amazon_product(
-                a,
-                device=device,
-                domain=domain,
-                country=country,
-                zip_code=zip_code,
-                language=language,
-                currency=currency,
-                add_html=parse_bool(add_html),
-                light_request=parse_bool(light_request),
-                screenshot=parse_bool(screenshot),
-                tag=tag,
-                retries=int(obj.get("retries") or 3),
-                backoff=float(obj.get("backoff") or 2.0),
-            )
+            return await client.amazon_product(a, **call_kwargs)
 
-        run_api_batch(
-            key=key,
-            inputs=inputs,
-            concurrency=concurrency,
-            from_user=obj["concurrency"] > 0,
-            skip_n=skip_n,
-            output_dir=obj.get("output_dir") or None,
-            verbose=obj["verbose"],
-            show_progress=obj.get("progress", True),
-            api_call=api_call,
-            on_complete=obj.get("on_complete"),
-            output_format=obj.get("output_format"),
-            post_process=obj.get("post_process"),
-            update_csv_path=input_file if obj.get("update_csv") else None,
-            input_column=obj.get("input_column"),
-            output_file=obj.get("output_file") or None,
-            extract_field=obj.get("extract_field"),
-            fields=obj.get("fields"),
-        )
+        run_batch_command(obj, key, input_file, api_call)
         return
 
     if not asin:
@@ -169,7 +124,7 @@ def amazon_product_cmd(
         raise SystemExit(1)
 
     async def _single() -> None:
-        async with Client(key, BASE_URL) as client:
+        async with Client(key, BASE_URL, cache_ttl=obj.get("cache_ttl", 0)) as client:
             data, headers, status_code = await client.amazon_product(
                 asin,
                 device=device,
@@ -259,69 +214,31 @@ def amazon_pricing_cmd(
     if not input_file and not asin:
         click.echo("expected one ASIN, or use --input-file for batch", err=True)
         raise SystemExit(1)
-    try:
-        key = get_api_key(None)
-    except ValueError as e:
-        click.echo(str(e), err=True)
-        raise SystemExit(1)
+    key = require_api_key()
 
     if input_file:
         if asin:
             click.echo("cannot use both --input-file and positional ASIN", err=True)
             raise SystemExit(1)
-        try:
-            inputs = read_input_file(input_file, input_column=obj.get("input_column"))
-        except ValueError as e:
-            click.echo(str(e), err=True)
-            raise SystemExit(1)
-        inputs = prepare_batch_inputs(inputs, obj)
-        usage_info = get_batch_usage(None)
-        try:
-            validate_batch_run(obj["concurrency"], len(inputs), usage_info)
-        except ValueError as e:
-            click.echo(str(e), err=True)
-            raise SystemExit(1)
-        concurrency = resolve_batch_concurrency(obj["concurrency"], usage_info, len(inputs))
-
-        skip_n = (
-            _find_completed_n(obj.get("output_dir") or "") if obj.get("resume") else frozenset()
+        # Invocation-invariant kwargs built once, not per batch item.
+        call_kwargs = dict(
+            device=device,
+            domain=domain,
+            country=country,
+            zip_code=zip_code,
+            language=language,
+            currency=currency,
+            add_html=parse_bool(add_html),
+            light_request=parse_bool(light_request),
+            tag=tag,
+            retries=int(obj.get("retries") or 3),
+            backoff=float(obj.get("backoff") or 2.0),
         )
 
         async def api_call(client, a):
-            return await client.amazon_pricing(
-                a,
-                device=device,
-                domain=domain,
-                country=country,
-                zip_code=zip_code,
-                language=language,
-                currency=currency,
-                add_html=parse_bool(add_html),
-                light_request=parse_bool(light_request),
-                tag=tag,
-                retries=int(obj.get("retries") or 3),
-                backoff=float(obj.get("backoff") or 2.0),
-            )
+            return await client.amazon_pricing(a, **call_kwargs)
 
-        run_api_batch(
-            key=key,
-            inputs=inputs,
-            concurrency=concurrency,
-            from_user=obj["concurrency"] > 0,
-            skip_n=skip_n,
-            output_dir=obj.get("output_dir") or None,
-            verbose=obj["verbose"],
-            show_progress=obj.get("progress", True),
-            api_call=api_call,
-            on_complete=obj.get("on_complete"),
-            output_format=obj.get("output_format"),
-            post_process=obj.get("post_process"),
-            update_csv_path=input_file if obj.get("update_csv") else None,
-            input_column=obj.get("input_column"),
-            output_file=obj.get("output_file") or None,
-            extract_field=obj.get("extract_field"),
-            fields=obj.get("fields"),
-        )
+        run_batch_command(obj, key, input_file, api_call)
         return
 
     if not asin:
@@ -329,7 +246,7 @@ def amazon_pricing_cmd(
         raise SystemExit(1)
 
     async def _single() -> None:
-        async with Client(key, BASE_URL) as client:
+        async with Client(key, BASE_URL, cache_ttl=obj.get("cache_ttl", 0)) as client:
             data, headers, status_code = await client.amazon_pricing(
                 asin,
                 device=device,
@@ -433,11 +350,7 @@ def amazon_search_cmd(
     if not input_file and not query:
         click.echo("expected one search query, or use --input-file for batch", err=True)
         raise SystemExit(1)
-    try:
-        key = get_api_key(None)
-    except ValueError as e:
-        click.echo(str(e), err=True)
-        raise SystemExit(1)
+    key = require_api_key()
     _validate_page(start_page, "start_page")
     _validate_page(pages, "pages")
 
@@ -445,66 +358,32 @@ def amazon_search_cmd(
         if query:
             click.echo("cannot use both --input-file and positional query", err=True)
             raise SystemExit(1)
-        try:
-            inputs = read_input_file(input_file, input_column=obj.get("input_column"))
-        except ValueError as e:
-            click.echo(str(e), err=True)
-            raise SystemExit(1)
-        inputs = prepare_batch_inputs(inputs, obj)
-        usage_info = get_batch_usage(None)
-        try:
-            validate_batch_run(obj["concurrency"], len(inputs), usage_info)
-        except ValueError as e:
-            click.echo(str(e), err=True)
-            raise SystemExit(1)
-        concurrency = resolve_batch_concurrency(obj["concurrency"], usage_info, len(inputs))
-
-        skip_n = (
-            _find_completed_n(obj.get("output_dir") or "") if obj.get("resume") else frozenset()
+        # Invocation-invariant kwargs built once, not per batch item.
+        call_kwargs = dict(
+            start_page=start_page,
+            pages=pages,
+            sort_by=norm_val(sort_by),
+            device=device,
+            domain=domain,
+            country=country,
+            zip_code=zip_code,
+            language=language,
+            currency=currency,
+            category_id=category_id,
+            merchant_id=merchant_id,
+            autoselect_variant=parse_bool(autoselect_variant),
+            add_html=parse_bool(add_html),
+            light_request=parse_bool(light_request),
+            screenshot=parse_bool(screenshot),
+            tag=tag,
+            retries=int(obj.get("retries") or 3),
+            backoff=float(obj.get("backoff") or 2.0),
         )
 
         async def api_call(client, q):
-            return await client.amazon_search(
-                q,
-                start_page=start_page,
-                pages=pages,
-                sort_by=norm_val(sort_by),
-                device=device,
-                domain=domain,
-                country=country,
-                zip_code=zip_code,
-                language=language,
-                currency=currency,
-                category_id=category_id,
-                merchant_id=merchant_id,
-                autoselect_variant=parse_bool(autoselect_variant),
-                add_html=parse_bool(add_html),
-                light_request=parse_bool(light_request),
-                screenshot=parse_bool(screenshot),
-                tag=tag,
-                retries=int(obj.get("retries") or 3),
-                backoff=float(obj.get("backoff") or 2.0),
-            )
+            return await client.amazon_search(q, **call_kwargs)
 
-        run_api_batch(
-            key=key,
-            inputs=inputs,
-            concurrency=concurrency,
-            from_user=obj["concurrency"] > 0,
-            skip_n=skip_n,
-            output_dir=obj.get("output_dir") or None,
-            verbose=obj["verbose"],
-            show_progress=obj.get("progress", True),
-            api_call=api_call,
-            on_complete=obj.get("on_complete"),
-            output_format=obj.get("output_format"),
-            post_process=obj.get("post_process"),
-            update_csv_path=input_file if obj.get("update_csv") else None,
-            input_column=obj.get("input_column"),
-            output_file=obj.get("output_file") or None,
-            extract_field=obj.get("extract_field"),
-            fields=obj.get("fields"),
-        )
+        run_batch_command(obj, key, input_file, api_call)
         return
 
     if not query:
@@ -512,7 +391,7 @@ def amazon_search_cmd(
         raise SystemExit(1)
 
     async def _single() -> None:
-        async with Client(key, BASE_URL) as client:
+        async with Client(key, BASE_URL, cache_ttl=obj.get("cache_ttl", 0)) as client:
             data, headers, status_code = await client.amazon_search(
                 query,
                 start_page=start_page,
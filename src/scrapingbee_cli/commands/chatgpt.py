@@ -6,25 +6,18 @@ import asyncio
 
 import click
 
-from ..batch import (
-    _find_completed_n,
-    get_batch_usage,
-    read_input_file,
-    resolve_batch_concurrency,
-    run_api_batch,
-    validate_batch_run,
-)
 from ..cli_utils import (
     BOOL_STR,
     _batch_options,
     check_api_response,
     parse_bool,
-    prepare_batch_inputs,
+    require_api_key,
+    run_batch_command,
     store_common_options,
     write_output,
 )
 from ..client import Client
-from ..config import BASE_URL, get_api_key
+from ..config import BASE_URL
 
 
 @click.command()
@@ -70,74 +63,38 @@ def chatgpt_cmd(
     if not input_file and not prompt:
         click.echo("expected at least one prompt argument, or use --input-file for batch", err=True)
         raise SystemExit(1)
-    try:
-        key = get_api_key(None)
-    except ValueError as e:
-        click.echo(str(e), err=True)
-        raise SystemExit(1)
+    key = require_api_key()
 
     if input_file:
         if prompt:
             click.echo("cannot use both --input-file and positional prompt", err=True)
             raise SystemExit(1)
-        try:
-            inputs = read_input_file(input_file, input_column=obj.get("input_column"))
-        except ValueError as e:
-            click.echo(str(e), err=True)
-            raise SystemExit(1)
-        inputs = prepare_batch_inputs(inputs, obj)
-        usage_info = get_batch_usage(None)
-        try:
-            validate_batch_run(obj["concurrency"], len(inputs), usage_info)
-        except ValueError as e:
-            click.echo(str(e), err=True)
-            raise SystemExit(1)
-        concurrency = resolve_batch_concurrency(obj["concurrency"], usage_info, len(inputs))
-
-        skip_n = (
-            _find_completed_n(obj.get("output_dir") or "") if obj.get("resume") else frozenset()
+        # Invocation-invariant kwargs built once, not per batch item.
+        call_kwargs = dict(
+            search=parse_bool(search),
+            add_html=parse_bool(add_html),
+            country_code=country_code,
+            tag=tag,
+            retries=int(obj.get("retries") or 3),
+            backoff=float(obj.get("backoff") or 2.0),
         )
 
         async def api_call(client, p):
-            return await client.chatgpt(
-                p,
-                search=parse_bool(search),
-                add_html=parse_bool(add_html),
-                country_code=country_code,
-                tag=tag,
-                retries=int(obj.get("retries") or 3),
-                backoff=float(obj.get("backoff") or 2.0),
-            )
+            return await client.chatgpt(p, **call_kwargs)
 
-        run_api_batch(
-            key=key,
-            inputs=inputs,
-            concurrency=concurrency,
-            from_user=obj["concurrency"] > 0,
-            skip_n=skip_n,
-            output_dir=obj.get("output_dir") or None,
-            verbose=obj["verbose"],
-            show_progress=obj.get("progress", True),
-            api_call=api_call,
-            on_complete=obj.get("on_complete"),
-            output_format=obj.get("output_format"),
-            post_process=obj.get("post_process"),
-            update_csv_path=input_file if obj.get("update_csv") else None,
-            input_column=obj.get("input_column"),
-            output_file=obj.get("output_file") or None,
-            extract_field=obj.get("extract_field"),
-            fields=obj.get("fields"),
-        )
+        run_batch_command(obj, key, input_file, api_call)
         return
 
     if not prompt:
         click.echo("expected at least one prompt argument, or use --input-file for batch", err=True)
         raise SystemExit(1)
 
-    prompt_str = " ".join(prompt)
+    # Single-argument prompts (quoted in the shell) pass through without the
+    # O(len) join copy; --input-file lines never reach this point at all.
+    prompt_str = prompt[0] if len(prompt) == 1 else " ".join(prompt)
 
     async def _single() -> None:
-        async with Client(key, BASE_URL) as client:
+        async with Client(key, BASE_URL, cache_ttl=obj.get("cache_ttl", 0)) as client:
             data, headers, status_code = await client.chatgpt(
                 prompt_str,
                 search=parse_bool(search),
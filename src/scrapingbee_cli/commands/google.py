@@ -7,14 +7,6 @@ import asyncio
 import click
 from click_option_group import optgroup
 
-from ..batch import (
-    _find_completed_n,
-    get_batch_usage,
-    read_input_file,
-    resolve_batch_concurrency,
-    run_api_batch,
-    validate_batch_run,
-)
 from ..cli_utils import (
     BOOL_STR,
     DEVICE_DESKTOP_MOBILE,
@@ -26,12 +18,13 @@ from ..cli_utils import (
     check_api_response,
     norm_val,
     parse_bool,
-    prepare_batch_inputs,
+    require_api_key,
+    run_batch_command,
     store_common_options,
     write_output,
 )
 from ..client import Client
-from ..config import BASE_URL, get_api_key
+from ..config import BASE_URL
 
 
 def _warn_empty_organic(data: bytes, search_type: str | None) -> None:
@@ -185,11 +178,7 @@ def google_cmd(
     if not input_file and not query:
         click.echo("expected one search query, or use --input-file for batch", err=True)
         raise SystemExit(1)
-    try:
-        key = get_api_key(None)
-    except ValueError as e:
-        click.echo(str(e), err=True)
-        raise SystemExit(1)
+    key = require_api_key()
     _validate_page(page)
     _validate_price_range(min_price, max_price)
     _validate_geolocation(latitude, longitude, radius)
@@ -198,67 +187,34 @@ def google_cmd(
         if query:
             click.echo("cannot use both --input-file and positional query", err=True)
             raise SystemExit(1)
-        try:
-            inputs = read_input_file(input_file, input_column=obj.get("input_column"))
-        except ValueError as e:
-            click.echo(str(e), err=True)
-            raise SystemExit(1)
-        inputs = prepare_batch_inputs(inputs, obj)
-        usage_info = get_batch_usage(None)
-        try:
-            validate_batch_run(obj["concurrency"], len(inputs), usage_info)
-        except ValueError as e:
-            click.echo(str(e), err=True)
-            raise SystemExit(1)
-        concurrency = resolve_batch_concurrency(obj["concurrency"], usage_info, len(inputs))
-
-        skip_n = (
-            _find_completed_n(obj.get("output_dir") or "") if obj.get("resume") else frozenset()
+        # Flag conversions are invocation-invariant — do them once here, not
+        # once per batch item inside api_call.
+        call_kwargs = dict(
+            search_type=norm_val(search_type),
+            country_code=country_code,
+            device=device,
+            page=page,
+            language=language,
+            nfpr=parse_bool(nfpr),
+            extra_params=extra_params,
+            add_html=parse_bool(add_html),
+            light_request=parse_bool(light_request),
+            tag=tag,
+            date_range=norm_val(date_range),
+            sort_by=norm_val(sort_by),
+            min_price=min_price,
+            max_price=max_price,
+            latitude=latitude,
+            longitude=longitude,
+            radius=radius,
+            retries=int(obj.get("retries") or 3),
+            backoff=float(obj.get("backoff") or 2.0),
         )
 
         async def api_call(client, q):
-            return await client.google_search(
-                q,
-                search_type=norm_val(search_type),
-                country_code=country_code,
-                device=device,
-                page=page,
-                language=language,
-                nfpr=parse_bool(nfpr),
-                extra_params=extra_params,
-                add_html=parse_bool(add_html),
-                light_request=parse_bool(light_request),
-                tag=tag,
-                date_range=norm_val(date_range),
-                sort_by=norm_val(sort_by),
-                min_price=min_price,
-                max_price=max_price,
-                latitude=latitude,
-                longitude=longitude,
-                radius=radius,
-                retries=int(obj.get("retries") or 3),
-                backoff=float(obj.get("backoff") or 2.0),
-            )
+            return await client.google_search(q, **call_kwargs)
 
-        run_api_batch(
-            key=key,
-            inputs=inputs,
-            concurrency=concurrency,
-            from_user=obj["concurrency"] > 0,
-            skip_n=skip_n,
-            output_dir=obj.get("output_dir") or None,
-            verbose=obj["verbose"],
-            show_progress=obj.get("progress", True),
-            api_call=api_call,
-            on_complete=obj.get("on_complete"),
-            output_format=obj.get("output_format"),
-            post_process=obj.get("post_process"),
-            update_csv_path=input_file if obj.get("update_csv") else None,
-            input_column=obj.get("input_column"),
-            output_file=obj.get("output_file") or None,
-            extract_field=obj.get("extract_field"),
-            fields=obj.get("fields"),
-        )
+        run_batch_command(obj, key, input_file, api_call)
         return
 
     if not query:
@@ -266,7 +222,7 @@ def google_cmd(
         raise SystemExit(1)
 
     async def _single() -> None:
-        async with Client(key, BASE_URL) as client:
+        async with Client(key, BASE_URL, cache_ttl=obj.get("cache_ttl", 0)) as client:
             data, headers, status_code = await client.google_search(
                 query,
                 search_type=norm_val(search_type),
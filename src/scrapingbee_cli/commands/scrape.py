@@ -13,6 +13,7 @@ from ..batch import (
     _find_completed_n,
     extension_for_crawl,
     get_batch_usage,
+    http_status_error,
     read_input_file,
     resolve_batch_concurrency,
     run_batch_async,
@@ -435,12 +436,18 @@ def scrape_cmd(
         _validate_json_option("--js-scenario", js_scenario)
         _validate_json_option("--extract-rules", extract_rules)
 
-        custom_headers = {}
+        # None when -H is unused (the common case) — skips the dict allocation
+        # and the `or None` fallback at the call site.
+        custom_headers: dict[str, str] | None = None
         for h in headers:
-            if ":" not in h:
+            # partition scans once and returns a tuple — no `in` pre-scan,
+            # no intermediate list from split.
+            k, sep, v = h.partition(":")
+            if not sep:
                 click.echo(f'Invalid header format "{h}", expected Key:Value', err=True)
                 raise SystemExit(1)
-            k, v = h.split(":", 1)
+            if custom_headers is None:
+                custom_headers = {}
             custom_headers[k.strip()] = v.strip()
 
         if parse_bool(screenshot) and screenshot_selector and parse_bool(screenshot_full_page):
@@ -467,7 +474,7 @@ def scrape_cmd(
             own_proxy=own_proxy,
             forward_headers=forward_headers,
             forward_headers_pure=forward_headers_pure,
-            custom_headers=custom_headers or None,
+            custom_headers=custom_headers,
             json_response=json_response,
             screenshot=screenshot,
             screenshot_selector=screenshot_selector,
@@ -536,9 +543,45 @@ def scrape_cmd(
         )
 
         async def _batch() -> None:
+            cache_ttl = obj.get("cache_ttl", 0)
             async with Client(
-                key, BASE_URL, connector_limit=concurrency, timeout=client_timeout
+                key,
+                BASE_URL,
+                connector_limit=concurrency,
+                timeout=client_timeout,
+                cache_ttl=cache_ttl,
             ) as client:
+                # The query params are identical for every URL — build them once
+                # so scrape() skips the per-item None-filter/bool-stringify pass.
+                # Not precomputed under --escalate-proxy, which varies the proxy
+                # params between attempts.
+                base_params = (
+                    None if escalate_proxy else Client.build_scrape_params(**scrape_kwargs)
+                )
+                # GET also gets the query string pre-encoded once (POST bodies
+                # keep the params-dict path inside scrape()). The response
+                # cache only hooks the params-dict path, so --cache-ttl runs
+                # keep the dict path to stay cacheable.
+                base_query = (
+                    Client.encode_scrape_query(base_params)
+                    if base_params is not None
+                    and cache_ttl == 0
+                    and (scrape_kwargs.get("method") or "GET").upper() == "GET"
+                    else None
+                )
+                # Custom headers get the same once-per-batch treatment as the
+                # params: derive the Spb- prefixed form here instead of per item.
+                ch = scrape_kwargs.get("custom_headers")
+                base_headers = None
+                if ch:
+                    base_headers = (
+                        {f"Spb-{k}": v for k, v in ch.items()}
+                        if (scrape_kwargs.get("method") or "GET").upper() == "GET"
+                        else dict(ch)
+                    )
+                # Bound method hoisted out of the closure: one LOAD_ATTR +
+                # bind per batch instead of per item.
+                scrape_fn = client.scrape
 
                 async def do_one(u: str):
                     try:
@@ -550,15 +593,19 @@ def scrape_cmd(
                                 verbose=obj["verbose"],
                             )
                         else:
-                            data, resp_headers, status_code = await client.scrape(
-                                u, **scrape_kwargs
+                            data, resp_headers, status_code = await scrape_fn(
+                                u,
+                                base_params=base_params,
+                                base_query=base_query,
+                                base_headers=base_headers,
+                                **scrape_kwargs,
                             )
                         if not scrape_kwargs.get("transparent_status_code") and status_code >= 400:
                             return (
                                 data,
                                 resp_headers,
                                 status_code,
-                                RuntimeError(f"HTTP {status_code}"),
+                                http_status_error(status_code),
                                 None,
                             )
                         if chunk_size > 0:
@@ -606,7 +653,49 @@ def scrape_cmd(
                         )
                     write_ndjson_line(result, fh=ndjson_fh, fields=obj.get("fields"))
 
-                on_result_cb = _ndjson_cb if output_format == "ndjson" else None
+                smart_ext = obj.get("smart_extract")
+                extract_field = obj.get("extract_field")
+                fields = obj.get("fields")
+
+                # Directory output streams each body to disk as it completes —
+                # O(concurrency) memory instead of holding every response until
+                # the batch ends (same scheme as run_api_batch).
+                dir_writer = None
+                if output_format not in ("ndjson", "csv") and not (
+                    obj.get("update_csv") and input_file
+                ):
+                    from ..batch import BatchDirWriter
+
+                    dir_writer = BatchDirWriter(
+                        obj.get("output_dir") or None,
+                        obj["verbose"],
+                        post_process=post_process,
+                        compress=obj.get("compress", "none"),
+                    )
+
+                def _dir_cb(result):
+                    if result.body and not result.error and not result.skipped:
+                        if smart_ext:
+                            from ..extract import smart_extract as _smart_extract_fn
+
+                            result.body = _smart_extract_fn(result.body, smart_ext)
+                        elif extract_field:
+                            from ..cli_utils import _extract_field_values
+
+                            result.body = _extract_field_values(result.body, extract_field)
+                        elif fields:
+                            from ..cli_utils import _filter_fields
+
+                            result.body = _filter_fields(result.body, fields)
+                    dir_writer.write_result(result)
+                    result.body = b""
+
+                if output_format == "ndjson":
+                    on_result_cb = _ndjson_cb
+                elif dir_writer is not None:
+                    on_result_cb = _dir_cb
+                else:
+                    on_result_cb = None
                 try:
                     results = await run_batch_async(
                         inputs,
@@ -616,6 +705,7 @@ def scrape_cmd(
                         skip_n=skip_n,
                         show_progress=obj.get("progress", True),
                         on_result=on_result_cb,
+                        hedge_after_ms=obj.get("hedge_after_ms", 0),
                     )
                 except BaseException:
                     if ndjson_fh:
@@ -623,22 +713,20 @@ def scrape_cmd(
                     raise
 
             # Apply smart-extract / extract-field / fields to batch results
-            smart_ext = obj.get("smart_extract")
-            extract_field = obj.get("extract_field")
-            fields = obj.get("fields")
-            if smart_ext:
+            # (the directory path already applied them per item in _dir_cb)
+            if smart_ext and dir_writer is None:
                 from ..extract import smart_extract as _smart_extract_fn
 
                 for r in results:
                     if r.body and not r.error and not r.skipped:
                         r.body = _smart_extract_fn(r.body, smart_ext)
-            elif extract_field:
+            elif extract_field and dir_writer is None:
                 from ..cli_utils import _extract_field_values
 
                 for r in results:
                     if r.body and not r.error and not r.skipped:
                         r.body = _extract_field_values(r.body, extract_field)
-            elif fields:
+            elif fields and dir_writer is None:
                 from ..cli_utils import _filter_fields
 
                 for r in results:
@@ -688,12 +776,15 @@ def scrape_cmd(
                     err=True,
                 )
             else:
-                out_dir, succeeded, failed = write_batch_output_to_dir(
-                    results,
-                    obj.get("output_dir") or None,
-                    obj["verbose"],
-                    post_process=post_process,
-                )
+                if dir_writer is not None:
+                    out_dir, succeeded, failed = dir_writer.finalize()
+                else:
+                    out_dir, succeeded, failed = write_batch_output_to_dir(
+                        results,
+                        obj.get("output_dir") or None,
+                        obj["verbose"],
+                        post_process=post_process,
+                    )
                 click.echo(
                     f"Batch complete: {succeeded} succeeded, {failed} failed. Output: {out_dir}",
                     err=True,
@@ -725,7 +816,9 @@ def scrape_cmd(
 
     async def _single() -> None:
         scrape_url = url or ""  # empty when using --scraping-config (API uses config's URL)
-        async with Client(key, BASE_URL, timeout=client_timeout) as client:
+        async with Client(
+            key, BASE_URL, timeout=client_timeout, cache_ttl=obj.get("cache_ttl", 0)
+        ) as client:
             if escalate_proxy:
                 data, resp_headers, status_code = await scrape_with_escalation(
                     client,
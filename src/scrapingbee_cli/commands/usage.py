@@ -8,9 +8,9 @@ import json as _json
 import click
 
 from ..batch import write_usage_file_cache
-from ..cli_utils import _output_options, store_common_options
+from ..cli_utils import _output_options, require_api_key, store_common_options
 from ..client import Client, parse_usage, pretty_json
-from ..config import BASE_URL, get_api_key
+from ..config import BASE_URL
 from ..theme import is_repl_mode
 
 
@@ -20,11 +20,7 @@ from ..theme import is_repl_mode
 def usage_cmd(obj: dict, **kwargs) -> None:
     """Check API credit usage and concurrency."""
     store_common_options(obj, **kwargs)
-    try:
-        key = get_api_key(None)
-    except ValueError as e:
-        click.echo(str(e), err=True)
-        raise SystemExit(1)
+    key = require_api_key()
     retries = int(obj.get("retries") or 3)
     backoff = float(obj.get("backoff") or 2.0)
 
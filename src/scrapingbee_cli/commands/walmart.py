@@ -7,14 +7,6 @@ import asyncio
 import click
 from click_option_group import optgroup
 
-from ..batch import (
-    _find_completed_n,
-    get_batch_usage,
-    read_input_file,
-    resolve_batch_concurrency,
-    run_api_batch,
-    validate_batch_run,
-)
 from ..cli_utils import (
     BOOL_STR,
     DEVICE_DESKTOP_MOBILE_TABLET,
@@ -25,12 +17,13 @@ from ..cli_utils import (
     check_api_response,
     norm_val,
     parse_bool,
-    prepare_batch_inputs,
+    require_api_key,
+    run_batch_command,
     store_common_options,
     write_output,
 )
 from ..client import Client
-from ..config import BASE_URL, get_api_key
+from ..config import BASE_URL
 
 WALMART_SORT_BY = ["best-match", "price-low", "price-high", "best-seller"]
 
@@ -106,11 +99,7 @@ def walmart_search_cmd(
     if not input_file and not query:
         click.echo("expected one search query, or use --input-file for batch", err=True)
         raise SystemExit(1)
-    try:
-        key = get_api_key(None)
-    except ValueError as e:
-        click.echo(str(e), err=True)
-        raise SystemExit(1)
+    key = require_api_key()
     _validate_page(start_page, "start_page")
     _validate_price_range(min_price, max_price)
 
@@ -118,64 +107,30 @@ def walmart_search_cmd(
         if query:
             click.echo("cannot use both --input-file and positional query", err=True)
             raise SystemExit(1)
-        try:
-            inputs = read_input_file(input_file, input_column=obj.get("input_column"))
-        except ValueError as e:
-            click.echo(str(e), err=True)
-            raise SystemExit(1)
-        inputs = prepare_batch_inputs(inputs, obj)
-        usage_info = get_batch_usage(None)
-        try:
-            validate_batch_run(obj["concurrency"], len(inputs), usage_info)
-        except ValueError as e:
-            click.echo(str(e), err=True)
-            raise SystemExit(1)
-        concurrency = resolve_batch_concurrency(obj["concurrency"], usage_info, len(inputs))
-
-        skip_n = (
-            _find_completed_n(obj.get("output_dir") or "") if obj.get("resume") else frozenset()
+        # Invocation-invariant kwargs built once, not per batch item.
+        call_kwargs = dict(
+            start_page=start_page,
+            min_price=min_price,
+            max_price=max_price,
+            sort_by=norm_val(sort_by),
+            device=device,
+            domain=domain,
+            fulfillment_speed=norm_val(fulfillment_speed),
+            fulfillment_type=norm_val(fulfillment_type),
+            delivery_zip=delivery_zip,
+            store_id=store_id,
+            add_html=parse_bool(add_html),
+            light_request=parse_bool(light_request),
+            screenshot=parse_bool(screenshot),
+            tag=tag,
+            retries=int(obj.get("retries") or 3),
+            backoff=float(obj.get("backoff") or 2.0),
         )
 
         async def api_call(client, q):
-            return await client.walmart_search(
-                q,
-                start_page=start_page,
-                min_price=min_price,
-                max_price=max_price,
-                sort_by=norm_val(sort_by),
-                device=device,
-                domain=domain,
-                fulfillment_speed=norm_val(fulfillment_speed),
-                fulfillment_type=norm_val(fulfillment_type),
-                delivery_zip=delivery_zip,
-                store_id=store_id,
-                add_html=parse_bool(add_html),
-                light_request=parse_bool(light_request),
-                screenshot=parse_bool(screenshot),
-                tag=tag,
-                retries=int(obj.get("retries") or 3),
-                backoff=float(obj.get("backoff") or 2.0),
-            )
+            return await client.walmart_search(q, **call_kwargs)
 
-        run_api_batch(
-            key=key,
-            inputs=inputs,
-            concurrency=concurrency,
-            from_user=obj["concurrency"] > 0,
-            skip_n=skip_n,
-            output_dir=obj.get("output_dir") or None,
-            verbose=obj["verbose"],
-            show_progress=obj.get("progress", True),
-            api_call=api_call,
-            on_complete=obj.get("on_complete"),
-            output_format=obj.get("output_format"),
-            post_process=obj.get("post_process"),
-            update_csv_path=input_file if obj.get("update_csv") else None,
-            input_column=obj.get("input_column"),
-            output_file=obj.get("output_file") or None,
-            extract_field=obj.get("extract_field"),
-            fields=obj.get("fields"),
-        )
+        run_batch_command(obj, key, input_file, api_call)
         return
 
     if not query:
@@ -183,7 +138,7 @@ def walmart_search_cmd(
         raise SystemExit(1)
 
     async def _single() -> None:
-        async with Client(key, BASE_URL) as client:
+        async with Client(key, BASE_URL, cache_ttl=obj.get("cache_ttl", 0)) as client:
             data, headers, status_code = await client.walmart_search(
                 query,
                 start_page=start_page,
@@ -265,68 +220,30 @@ def walmart_product_cmd(
     if not input_file and not product_id:
         click.echo("expected one product ID, or use --input-file for batch", err=True)
         raise SystemExit(1)
-    try:
-        key = get_api_key(None)
-    except ValueError as e:
-        click.echo(str(e), err=True)
-        raise SystemExit(1)
+    key = require_api_key()
 
     if input_file:
         if product_id:
             click.echo("cannot use both --input-file and positional product-id", err=True)
             raise SystemExit(1)
-        try:
-            inputs = read_input_file(input_file, input_column=obj.get("input_column"))
-        except ValueError as e:
-            click.echo(str(e), err=True)
-            raise SystemExit(1)
-        inputs = prepare_batch_inputs(inputs, obj)
-        usage_info = get_batch_usage(None)
-        try:
-            validate_batch_run(obj["concurrency"], len(inputs), usage_info)
-        except ValueError as e:
-            click.echo(str(e), err=True)
-            raise SystemExit(1)
-        concurrency = resolve_batch_concurrency(obj["concurrency"], usage_info, len(inputs))
-
-        skip_n = (
-            _find_completed_n(obj.get("output_dir") or "") if obj.get("resume") else frozenset()
+        # Invocation-invariant kwargs built once, not per batch item.
+        call_kwargs = dict(
+            device=device,
+            domain=domain,
+            delivery_zip=delivery_zip,
+            store_id=store_id,
+            add_html=parse_bool(add_html),
+            light_request=parse_bool(light_request),
+            screenshot=parse_bool(screenshot),
+            tag=tag,
+            retries=int(obj.get("retries") or 3),
+            backoff=float(obj.get("backoff") or 2.0),
         )
 
         async def api_call(client, pid):
-            return await client.walmart_product(
-                pid,
-                device=device,
-                domain=domain,
-                delivery_zip=delivery_zip,
-                store_id=store_id,
-                add_html=parse_bool(add_html),
-                light_request=parse_bool(light_request),
-                screenshot=parse_bool(screenshot),
-                tag=tag,
-                retries=int(obj.get("retries") or 3),
-                backoff=float(obj.get("backoff") or 2.0),
-            )
+            return await client.walmart_product(pid, **call_kwargs)
 
-        run_api_batch(
-            key=key,
-            inputs=inputs,
-            concurrency=concurrency,
-            from_user=obj["concurrency"] > 0,
-            skip_n=skip_n,
-            output_dir=obj.get("output_dir") or None,
-            verbose=obj["verbose"],
-            show_progress=obj.get("progress", True),
-            api_call=api_call,
-            on_complete=obj.get("on_complete"),
-            output_format=obj.get("output_format"),
-            post_process=obj.get("post_process"),
-            update_csv_path=input_file if obj.get("update_csv") else None,
-            input_column=obj.get("input_column"),
-            output_file=obj.get("output_file") or None,
-            extract_field=obj.get("extract_field"),
-            fields=obj.get("fields"),
-        )
+        run_batch_command(obj, key, input_file, api_call)
         return
 
     if not product_id:
@@ -334,7 +251,7 @@ def walmart_product_cmd(
         raise SystemExit(1)
 
     async def _single() -> None:
-        async with Client(key, BASE_URL) as client:
+        async with Client(key, BASE_URL, cache_ttl=obj.get("cache_ttl", 0)) as client:
             data, headers, status_code = await client.walmart_product(
                 product_id,
                 device=device,
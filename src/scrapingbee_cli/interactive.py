@@ -5429,7 +5429,7 @@ def run_repl(
         import hashlib as _hashlib
         import json as _json
 
-        from .batch import read_usage_file_cache, write_usage_file_cache
+        from .batch import read_usage_file_cache, seed_usage_cache, write_usage_file_cache
         from .client import Client, parse_usage
         from .config import BASE_URL, get_api_key
 
@@ -5489,7 +5489,9 @@ def run_repl(
                 return
             state.update_from_usage_response(raw, key_hash=key_hash)
             try:
-                write_usage_file_cache(key, parse_usage(data))
+                parsed = parse_usage(data)
+                write_usage_file_cache(key, parsed)
+                seed_usage_cache(key, parsed)
             except Exception:
                 pass
             try:
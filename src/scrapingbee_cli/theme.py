@@ -1025,21 +1025,11 @@ def print_styled_version(version: str) -> None:
 
         api_key = get_api_key(None)
         if api_key:
-            import asyncio
+            # Goes through the shared usage cache, so the banner's lookup is
+            # reused by any batch pre-flight that follows within the TTL.
+            from .batch import get_batch_usage
 
-            from .client import Client
-            from .config import BASE_URL
-
-            async def _check():
-                async with Client(api_key, BASE_URL, timeout=10) as c:
-                    body, _, code = await c.usage()
-                    if code == 200:
-                        from .client import parse_usage
-
-                        return parse_usage(body)
-                return None
-
-            usage = asyncio.run(_check())
+            usage = get_batch_usage(None)
             if usage:
                 remaining = usage.get("credits", 0)
                 err_console.print(
@@ -12,11 +12,17 @@ from scrapingbee_cli.batch import (
     CONCURRENCY_CAP,
     MIN_CREDITS_TO_RUN_BATCH,
     BatchResult,
+    _AimdController,
     _find_completed_n,
+    _ResizableSemaphore,
+    apply_post_process_many,
     extension_for_scrape,
     extension_from_body_sniff,
     extension_from_content_type,
+    get_batch_usage,
+    http_status_error,
     resolve_batch_concurrency,
+    run_batch,
     run_batch_async,
     validate_batch_run,
     write_batch_output_to_dir,
@@ -71,6 +77,63 @@ class TestValidateBatchRun:
             validate_batch_run(10, 1, usage)
 
 
+class TestGetBatchUsageProcessCache:
+    """Tests for the in-process TTL cache in get_batch_usage()."""
+
+    @pytest.fixture(autouse=True)
+    def _clean_cache(self, monkeypatch):
+        import scrapingbee_cli.batch as batch_mod
+
+        monkeypatch.setattr(batch_mod, "_usage_cache", {})
+        monkeypatch.setenv("SCRAPINGBEE_API_KEY", "test-key")
+
+    def test_second_call_within_ttl_skips_fetch(self, monkeypatch):
+        import scrapingbee_cli.batch as batch_mod
+
+        calls = []
+
+        async def fake_fetch(key):
+            calls.append(key)
+            return {"max_concurrency": 7, "credits": 1000}
+
+        monkeypatch.setattr(batch_mod, "_fetch_usage_async", fake_fetch)
+        first = get_batch_usage(None)
+        second = get_batch_usage(None)
+        assert first == second == {"max_concurrency": 7, "credits": 1000}
+        assert len(calls) == 1
+
+    def test_expired_entry_refetches(self, monkeypatch):
+        import scrapingbee_cli.batch as batch_mod
+
+        calls = []
+
+        async def fake_fetch(key):
+            calls.append(key)
+            return {"max_concurrency": 7, "credits": 1000}
+
+        monkeypatch.setattr(batch_mod, "_fetch_usage_async", fake_fetch)
+        get_batch_usage(None)
+        # Age the cached entry past the TTL.
+        khash, (ts, data) = next(iter(batch_mod._usage_cache.items()))
+        batch_mod._usage_cache[khash] = (ts - batch_mod._USAGE_CACHE_TTL - 1, data)
+        get_batch_usage(None)
+        assert len(calls) == 2
+
+    def test_different_keys_cached_separately(self, monkeypatch):
+        import scrapingbee_cli.batch as batch_mod
+
+        calls = []
+
+        async def fake_fetch(key):
+            calls.append(key)
+            return {"max_concurrency": 7, "credits": 1000}
+
+        monkeypatch.setattr(batch_mod, "_fetch_usage_async", fake_fetch)
+        get_batch_usage("key-a")
+        get_batch_usage("key-b")
+        assert calls == ["key-a", "key-b"]
+
+
 class TestFindCompletedN:
     """Tests for _find_completed_n()."""
 
@@ -147,6 +210,253 @@ class TestRunBatchAsyncSkipN:
         assert set(calls) == {"a", "b"}
 
 
+class TestAimdController:
+    """Tests for the adaptive (AIMD) concurrency controller."""
+
+    def test_no_adjustment_before_full_window(self):
+        c = _AimdController(cap=10)
+        for _ in range(_AimdController.WINDOW - 1):
+            assert c.record(429, None, 10) is None
+
+    def test_halves_on_sustained_backpressure(self):
+        c = _AimdController(cap=10)
+        new = None
+        for _ in range(_AimdController.WINDOW):
+            new = c.record(429, None, 10)
+        assert new == 5
+
+    def test_transport_errors_count_as_backpressure(self):
+        c = _AimdController(cap=10)
+        new = None
+        for _ in range(_AimdController.WINDOW):
+            new = c.record(0, RuntimeError("conn reset"), 8)
+        assert new == 4
+
+    def test_clean_window_recovers_toward_cap(self):
+        c = _AimdController(cap=10)
+        new = None
+        for _ in range(_AimdController.WINDOW):
+            new = c.record(200, None, 5)
+        assert new == 6
+
+    def test_never_exceeds_cap(self):
+        c = _AimdController(cap=5)
+        new = None
+        for _ in range(_AimdController.WINDOW):
+            new = c.record(200, None, 5)
+        assert new is None
+
+    def test_never_drops_below_one(self):
+        c = _AimdController(cap=10)
+        new = None
+        for _ in range(_AimdController.WINDOW):
+            new = c.record(503, None, 1)
+        assert new is None  # current_limit == 1 — no further decrease
+
+    def test_application_4xx_is_not_backpressure(self):
+        # do_one returns http_status_error(404) for a missing page, but a
+        # 404-heavy batch is not a reason to slow down — the window stays clean
+        # and the limit can still grow back toward the cap.
+        c = _AimdController(cap=10)
+        new = None
+        for _ in range(_AimdController.WINDOW):
+            new = c.record(404, http_status_error(404), 5)
+        assert new == 6
+        assert c.halvings == 0
+
+    def test_counts_adjustments_for_summary(self):
+        c = _AimdController(cap=10)
+        for _ in range(_AimdController.WINDOW):
+            c.record(429, None, 10)
+        for _ in range(_AimdController.WINDOW):
+            c.record(200, None, 5)
+        assert c.halvings == 1
+        assert c.growths == 1
+
+
+class TestHttpStatusError:
+    """Tests for the shared per-status-code error instances."""
+
+    def test_same_code_returns_same_instance(self):
+        assert http_status_error(429) is http_status_error(429)
+
+    def test_message_and_distinct_codes(self):
+        assert str(http_status_error(503)) == "HTTP 503"
+        assert http_status_error(503) is not http_status_error(429)
+
+
+class TestResizableSemaphore:
+    """Tests for _ResizableSemaphore limit changes."""
+
+    def test_acquire_release_respects_limit(self):
+        async def run():
+            sem = _ResizableSemaphore(2)
+            active = 0
+            peak = 0
+
+            async def worker():
+                nonlocal active, peak
+                async with sem:
+                    active += 1
+                    peak = max(peak, active)
+                    await asyncio.sleep(0.002)
+                    active -= 1
+
+            await asyncio.gather(*(worker() for _ in range(10)))
+            return peak
+
+        assert asyncio.run(run()) <= 2
+
+    def test_shrunk_limit_applies_to_new_acquires(self):
+        async def run():
+            sem = _ResizableSemaphore(4)
+            await sem.set_limit(1)
+            active = 0
+            peak = 0
+
+            async def worker():
+                nonlocal active, peak
+                async with sem:
+                    active += 1
+                    peak = max(peak, active)
+                    await asyncio.sleep(0.002)
+                    active -= 1
+
+            await asyncio.gather(*(worker() for _ in range(6)))
+            return peak
+
+        assert asyncio.run(run()) == 1
+
+
+class TestRunBatchAsyncWindow:
+    """Tests for the bounded sliding-window dispatch in run_batch_async."""
+
+    def test_results_keep_input_order(self):
+        async def do_one(inp: str):
+            # Reverse-ish latency so completion order differs from input order.
+            await asyncio.sleep(0.001 * (5 - int(inp) % 5))
+            return inp.encode(), {}, 200, None, None
+
+        async def run():
+            return await run_batch_async(
+                [str(i) for i in range(20)],
+                concurrency=4,
+                async_fn=do_one,
+                show_progress=False,
+            )
+
+        results = asyncio.run(run())
+        assert [r.input for r in results] == [str(i) for i in range(20)]
+
+    def test_per_item_exception_recorded_not_raised(self):
+        async def do_one(inp: str):
+            if inp == "bad":
+                raise ValueError("boom")
+            return inp.encode(), {}, 200, None, None
+
+        async def run():
+            return await run_batch_async(
+                ["ok", "bad", "ok2"],
+                concurrency=2,
+                async_fn=do_one,
+                show_progress=False,
+            )
+
+        results = asyncio.run(run())
+        assert results[0].error is None
+        assert isinstance(results[1].error, ValueError)
+        assert results[2].error is None
+
+    def test_in_flight_bounded_by_concurrency(self):
+        active = 0
+        peak = 0
+
+        async def do_one(inp: str):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.002)
+            active -= 1
+            return b"", {}, 200, None, None
+
+        async def run():
+            return await run_batch_async(
+                [str(i) for i in range(30)],
+                concurrency=3,
+                async_fn=do_one,
+                show_progress=False,
+            )
+
+        asyncio.run(run())
+        assert peak <= 3
+
+
+class TestRunBatchSyncShim:
+    """Tests for the sync run_batch() wrapper."""
+
+    def test_runs_without_event_loop(self):
+        async def do_one(inp: str):
+            return inp.upper().encode(), {}, 200, None, None
+
+        results = run_batch(["a", "b"], concurrency=2, async_fn=do_one, show_progress=False)
+        assert [r.body for r in results] == [b"A", b"B"]
+        assert all(r.error is None for r in results)
+
+    def test_passes_skip_n_through(self):
+        async def do_one(inp: str):
+            return inp.encode(), {}, 200, None, None
+
+        results = run_batch(
+            ["a", "b"],
+            concurrency=1,
+            async_fn=do_one,
+            skip_n=frozenset({1}),
+            show_progress=False,
+        )
+        assert results[0].skipped is True
+        assert results[1].skipped is False
+
+
+class TestApplyPostProcessMany:
+    """Tests for apply_post_process_many()."""
+
+    @pytest.fixture(autouse=True)
+    def _open_gate(self, monkeypatch):
+        import scrapingbee_cli.audit as audit_mod
+        import scrapingbee_cli.exec_gate as gate_mod
+
+        monkeypatch.setattr(gate_mod, "require_exec", lambda *a, **k: None)
+        monkeypatch.setattr(audit_mod, "log_exec", lambda *a, **k: None)
+
+    def _result(self, index, body=b"", error=None, skipped=False):
+        return BatchResult(
+            index=index,
+            input=f"u{index}",
+            body=body,
+            headers={},
+            status_code=200,
+            error=error,
+            skipped=skipped,
+        )
+
+    def test_processes_successful_bodies_in_place(self):
+        results = [self._result(0, b"hello"), self._result(1, b"world")]
+        apply_post_process_many(results, "tr a-z A-Z")
+        assert results[0].body == b"HELLO"
+        assert results[1].body == b"WORLD"
+
+    def test_skips_errored_skipped_and_empty(self):
+        results = [
+            self._result(0, b"keep", error=RuntimeError("boom")),
+            self._result(1, b"keep", skipped=True),
+            self._result(2, b""),
+        ]
+        apply_post_process_many(results, "tr a-z A-Z")
+        assert results[0].body == b"keep"
+        assert results[1].body == b"keep"
+        assert results[2].body == b""
+
+
 class TestWriteBatchOutputToDir:
     """Tests for write_batch_output_to_dir manifest.json writing."""
 
@@ -254,6 +564,51 @@ class TestWriteBatchOutputToDir:
         write_batch_output_to_dir(results, str(tmp_path), verbose=False)
         assert not (tmp_path / "manifest.json").exists()
 
+    def test_failures_appended_to_errors_jsonl(self, tmp_path):
+        """Failed items land as one JSON line each in errors.jsonl, not per-item files."""
+        results = [
+            self._make_result(0, "https://example.com/ok", b'{"ok":true}'),
+            BatchResult(
+                index=1,
+                input="https://example.com/fail",
+                body=b"server said no",
+                headers={},
+                status_code=500,
+                error=RuntimeError("boom"),
+                fetched_at="",
+            ),
+        ]
+        write_batch_output_to_dir(results, str(tmp_path), verbose=False)
+
+        assert not (tmp_path / "2.err").exists()
+        lines = (tmp_path / "errors.jsonl").read_text().splitlines()
+        assert len(lines) == 1
+        entry = json.loads(lines[0])
+        assert entry["index"] == 2
+        assert entry["input"] == "https://example.com/fail"
+        assert entry["status_code"] == 500
+        assert entry["error"] == "boom"
+        assert entry["body"] == "server said no"
+
+    def test_legacy_err_files_env_restores_per_item_files(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("SCRAPINGBEE_LEGACY_ERR_FILES", "1")
+        results = [
+            BatchResult(
+                index=0,
+                input="https://example.com/fail",
+                body=b"",
+                headers={},
+                status_code=0,
+                error=RuntimeError("boom"),
+                fetched_at="",
+            ),
+        ]
+        write_batch_output_to_dir(results, str(tmp_path), verbose=False)
+
+        assert not (tmp_path / "errors.jsonl").exists()
+        entry = json.loads((tmp_path / "1.err").read_text())
+        assert entry["error"] == "boom"
+
     def test_screenshot_uses_subdir_in_manifest(self, tmp_path):
         """Screenshot outputs are stored in screenshots/ and manifest reflects that."""
         result = BatchResult(
@@ -271,6 +626,35 @@ class TestWriteBatchOutputToDir:
         manifest = json.loads((tmp_path / "manifest.json").read_text())
         assert manifest["https://example.com/page"]["file"] == "screenshots/1.png"
 
+    def test_gzip_compression_writes_gz_files(self, tmp_path):
+        """--compress gzip stores N.<ext>.gz; sha256 covers the uncompressed body."""
+        import gzip
+        import hashlib
+
+        from scrapingbee_cli.batch import BatchDirWriter
+
+        body = b'{"a": 1}' * 50
+        writer = BatchDirWriter(str(tmp_path), verbose=False, compress="gzip")
+        writer.write_result(self._make_result(0, "https://a.com", body))
+        writer.finalize()
+
+        out = tmp_path / "1.json.gz"
+        assert out.exists()
+        assert gzip.decompress(out.read_bytes()) == body
+        manifest = json.loads((tmp_path / "manifest.json").read_text())
+        entry = manifest["https://a.com"]
+        assert entry["file"] == "1.json.gz"
+        assert entry["content_sha256"] == hashlib.sha256(body).hexdigest()
+
+    def test_gzip_output_counts_for_resume(self, tmp_path):
+        """Compressed outputs are recognized by _find_completed_n for --resume."""
+        from scrapingbee_cli.batch import BatchDirWriter
+
+        writer = BatchDirWriter(str(tmp_path), verbose=False, compress="gzip")
+        writer.write_result(self._make_result(2, "https://b.com", b"{}"))
+        writer.finalize()
+        assert _find_completed_n(str(tmp_path)) == frozenset({3})
+
 
 class TestWriteBatchOutputToDirManifestFields:
     """Tests that manifest.json contains credits_used, latency_ms, content_sha256 (T-04)."""
@@ -341,10 +725,23 @@ class TestWriteBatchOutputToDirManifestFields:
 class TestResolveBatchConcurrency:
     """Tests for resolve_batch_concurrency()."""
 
-    def test_zero_returns_usage_limit(self):
+    def test_zero_returns_usage_limit(self, monkeypatch):
+        monkeypatch.setattr("scrapingbee_cli.batch._client_concurrency_ceiling", lambda: 64)
         result = resolve_batch_concurrency(0, {"max_concurrency": 10}, 5, warn=False)
         assert result == 10
 
+    def test_zero_clamped_to_client_capacity(self, monkeypatch):
+        """Auto mode caps the plan limit at the client machine's own ceiling."""
+        monkeypatch.setattr("scrapingbee_cli.batch._client_concurrency_ceiling", lambda: 8)
+        result = resolve_batch_concurrency(0, {"max_concurrency": 50}, 100, warn=False)
+        assert result == 8
+
+    def test_user_value_not_clamped_to_client_capacity(self, monkeypatch):
+        """An explicit --concurrency wins over the machine-derived ceiling."""
+        monkeypatch.setattr("scrapingbee_cli.batch._client_concurrency_ceiling", lambda: 8)
+        result = resolve_batch_concurrency(20, {"max_concurrency": 50}, 100, warn=False)
+        assert result == 20
+
     def test_zero_with_zero_limit_uses_fallback(self):
         # max_concurrency=0 is treated as "unset" (or 5 fallback), so returns 5
         result = resolve_batch_concurrency(0, {"max_concurrency": 0}, 5, warn=False)
@@ -512,3 +909,81 @@ class TestReadInputFile:
 
         with pytest.raises(ValueError, match="cannot open"):
             read_input_file("/nonexistent/path/file.txt")
+
+
+class TestHedgedCall:
+    """Tests for _hedged_call() tail-latency hedging."""
+
+    def _ok(self, tag: str):
+        return (tag.encode(), {}, 200, None, None)
+
+    def test_fast_primary_wins_without_hedging(self):
+        from scrapingbee_cli.batch import _hedged_call
+
+        calls = []
+
+        async def fn(inp):
+            calls.append(inp)
+            return self._ok("primary")
+
+        async def run():
+            sem = asyncio.Semaphore(1)
+            return await _hedged_call(fn, "x", 1000, sem)
+
+        body, _, status, err, _ = asyncio.run(run())
+        assert body == b"primary"
+        assert calls == ["x"]
+
+    def test_slow_primary_spawns_hedge_and_hedge_wins(self):
+        from scrapingbee_cli.batch import _hedged_call
+
+        calls = []
+
+        async def fn(inp):
+            calls.append(inp)
+            if len(calls) == 1:
+                await asyncio.sleep(5)
+                return self._ok("primary")
+            return self._ok("hedge")
+
+        async def run():
+            sem = asyncio.Semaphore(1)
+            return await _hedged_call(fn, "x", 10, sem)
+
+        body, _, status, err, _ = asyncio.run(run())
+        assert body == b"hedge"
+        assert calls == ["x", "x"]
+
+    def test_no_free_hedge_slot_waits_for_primary(self):
+        from scrapingbee_cli.batch import _hedged_call
+
+        calls = []
+
+        async def fn(inp):
+            calls.append(inp)
+            await asyncio.sleep(0.05)
+            return self._ok("primary")
+
+        async def run():
+            sem = asyncio.Semaphore(1)
+            await sem.acquire()  # all hedge slots busy
+            try:
+                return await _hedged_call(fn, "x", 10, sem)
+            finally:
+                sem.release()
+
+        body, *_ = asyncio.run(run())
+        assert body == b"primary"
+        assert calls == ["x"]  # no duplicate fired
+
+    def test_run_batch_async_accepts_hedge_after_ms(self):
+        async def fn(inp):
+            return (b"ok", {}, 200, None, None)
+
+        async def run():
+            return await run_batch_async(
+                ["a", "b"], 2, fn, show_progress=False, hedge_after_ms=1000
+            )
+
+        results = asyncio.run(run())
+        assert [r.body for r in results] == [b"ok", b"ok"]
@@ -876,3 +876,42 @@ class TestCrawlSaveReporting:
         )
         assert result.exit_code == 0, result.output + result.stderr
         assert str(out_dir.resolve()) in result.stderr
+
+
+class TestLazyCommandLoading:
+    """LazyGroup defers command-module imports until first use."""
+
+    def test_get_command_loads_on_demand(self):
+        from scrapingbee_cli.commands import LazyGroup
+
+        group = LazyGroup()
+        assert group.commands == {}
+        assert group.get_command(None, "usage") is not None
+        assert "usage" in group.commands
+        # Sibling modules stay unloaded
+        assert "scrape" not in group.commands
+
+    def test_module_registering_siblings_loads_them_together(self):
+        from scrapingbee_cli.commands import LazyGroup
+
+        group = LazyGroup()
+        assert group.get_command(None, "docs") is not None
+        assert {"auth", "docs", "logout"} <= set(group.commands)
+
+    def test_unknown_command_returns_none(self):
+        from scrapingbee_cli.commands import LazyGroup
+
+        assert LazyGroup().get_command(None, "not-a-command") is None
+
+    def test_list_commands_covers_static_map(self):
+        from scrapingbee_cli.commands import COMMAND_MODULES, LazyGroup
+
+        group = LazyGroup()
+        assert group.list_commands(None) == sorted(set(COMMAND_MODULES))
+
+    def test_load_all_materializes_every_command(self):
+        from scrapingbee_cli.commands import COMMAND_MODULES, LazyGroup
+
+        group = LazyGroup()
+        group.load_all()
+        assert set(group.commands) == set(COMMAND_MODULES)
@@ -620,3 +620,97 @@ class TestEstimatedCredits:
         for cmd, cost in ESTIMATED_CREDITS.items():
             assert isinstance(cost, str), f"{cmd}: cost should be str"
             assert cost.strip(), f"{cmd}: cost should be non-empty"
+
+
+class TestRunBatchCommand:
+    """run_batch_command() — shared --input-file pipeline."""
+
+    def _obj(self, **over) -> dict:
+        obj = {"concurrency": 0, "verbose": False}
+        obj.update(over)
+        return obj
+
+    def test_forwards_pipeline_results_to_run_api_batch(self, tmp_path, monkeypatch):
+        import scrapingbee_cli.batch as batch
+        from scrapingbee_cli.cli_utils import run_batch_command
+
+        f = tmp_path / "in.txt"
+        f.write_text("https://a.example\nhttps://b.example\n")
+        monkeypatch.setattr(
+            batch, "get_batch_usage", lambda k: {"max_concurrency": 5, "credits": 1000}
+        )
+        seen: dict = {}
+        monkeypatch.setattr(batch, "run_api_batch", lambda **kw: seen.update(kw))
+
+        async def api_call(client, x):  # pragma: no cover - never awaited
+            raise AssertionError
+
+        run_batch_command(self._obj(), "KEY", str(f), api_call)
+        assert seen["inputs"] == ["https://a.example", "https://b.example"]
+        assert seen["key"] == "KEY"
+        assert seen["from_user"] is False
+        assert seen["skip_n"] == frozenset()
+        assert seen["api_call"] is api_call
+        assert seen["update_csv_path"] is None
+
+    def test_invalid_input_file_exits(self, capsys):
+        from scrapingbee_cli.cli_utils import run_batch_command
+
+        with pytest.raises(SystemExit):
+            run_batch_command(self._obj(), "KEY", "/nonexistent/in.txt", None)
+        assert "cannot open" in capsys.readouterr().err
+
+    def test_insufficient_credits_exits(self, tmp_path, monkeypatch, capsys):
+        import scrapingbee_cli.batch as batch
+        from scrapingbee_cli.cli_utils import run_batch_command
+
+        f = tmp_path / "in.txt"
+        f.write_text("https://a.example\n")
+        monkeypatch.setattr(
+            batch, "get_batch_usage", lambda k: {"max_concurrency": 5, "credits": 0}
+        )
+        with pytest.raises(SystemExit):
+            run_batch_command(self._obj(), "KEY", str(f), None)
+        assert "insufficient credits" in capsys.readouterr().err
+
+
+class TestRequireApiKey:
+    """require_api_key() — get_api_key with the standard CLI error handling."""
+
+    def test_returns_key_from_env(self, monkeypatch):
+        from scrapingbee_cli.cli_utils import require_api_key
+
+        monkeypatch.setenv("SCRAPINGBEE_API_KEY", "env-key")
+        assert require_api_key() == "env-key"
+
+    def test_flag_value_wins(self, monkeypatch):
+        from scrapingbee_cli.cli_utils import require_api_key
+
+        monkeypatch.setenv("SCRAPINGBEE_API_KEY", "env-key")
+        assert require_api_key("flag-key") == "flag-key"
+
+    def test_missing_key_exits_with_message(self, monkeypatch, capsys):
+        from scrapingbee_cli.cli_utils import require_api_key
+
+        monkeypatch.delenv("SCRAPINGBEE_API_KEY", raising=False)
+        with pytest.raises(SystemExit):
+            require_api_key()
+        assert "API key not set" in capsys.readouterr().err
+
+
+class TestPrepareBatchInputsDuplicateNote:
+    """prepare_batch_inputs() nudges toward --deduplicate when duplicates exist."""
+
+    def test_warns_on_duplicates_without_flag(self, capsys):
+        from scrapingbee_cli.cli_utils import prepare_batch_inputs
+
+        inputs = ["https://a", "https://b", "https://a"]
+        result = prepare_batch_inputs(inputs, {"deduplicate": False, "sample": 0})
+        assert result == inputs  # inputs untouched
+        assert "1 duplicate item(s)" in capsys.readouterr().err
+
+    def test_silent_when_no_duplicates(self, capsys):
+        from scrapingbee_cli.cli_utils import prepare_batch_inputs
+
+        prepare_batch_inputs(["https://a", "https://b"], {"deduplicate": False, "sample": 0})
+        assert "duplicate" not in capsys.readouterr().err
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import os
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -95,6 +96,13 @@ class TestPrettyJson:
         out = pretty_json(data)
         assert "<html>" in out
 
+    def test_leading_whitespace_still_pretty_prints(self):
+        assert pretty_json(b"  \n\t[1, 2]") == "[\n  1,\n  2\n]"
+
+    def test_binary_body_decoded_without_parse(self):
+        out = pretty_json(b"\x89PNG\r\n\x1a\n")
+        assert "PNG" in out
+
 
 class TestGetWithRetry:
     """Tests for Client._get_with_retry()."""
@@ -159,6 +167,35 @@ class TestGetWithRetry:
 
         asyncio.run(run())
 
+    def test_retries_on_429_and_honours_retry_after(self):
+        async def run():
+            client = Client("fake-key")
+            with patch.object(client, "_get", new_callable=AsyncMock) as m:
+                m.side_effect = [(b"slow", {"Retry-After": "0.01"}, 429), (b"ok", {}, 200)]
+                out = await client._get_with_retry(
+                    "/usage", {"api_key": "k"}, retries=2, backoff=0.01
+                )
+            assert out == (b"ok", {}, 200)
+            assert m.call_count == 2
+
+        asyncio.run(run())
+
+    def test_scrape_does_not_retry_transparent_429(self):
+        async def run():
+            client = Client("fake-key")
+            with patch.object(client, "_get", new_callable=AsyncMock) as m:
+                m.return_value = (b"slow", {}, 429)
+                out = await client.scrape(
+                    "https://example.com",
+                    transparent_status_code=True,
+                    retries=2,
+                    backoff=0.01,
+                )
+            assert out[2] == 429
+            assert m.call_count == 1  # target's own 429 — each retry costs credits
+
+        asyncio.run(run())
+
     def test_retries_on_timeout_error_then_returns(self):
         async def run():
             client = Client("fake-key")
@@ -215,6 +252,104 @@ _FIRST_ARG = {
 }
 
 
+class TestBuildScrapeParams:
+    """Tests for Client.build_scrape_params()."""
+
+    def test_converts_bools_and_ints_to_strings(self):
+        params = Client.build_scrape_params(
+            render_js=True, block_ads=False, wait=500, country_code="us"
+        )
+        assert params == {
+            "render_js": "true",
+            "block_ads": "false",
+            "wait": "500",
+            "country_code": "us",
+        }
+
+    def test_get_method_and_none_values_omitted(self):
+        assert Client.build_scrape_params(method="GET", render_js=None) == {}
+
+    def test_non_get_method_included(self):
+        assert Client.build_scrape_params(method="post")["method"] == "POST"
+
+    def test_non_param_kwargs_ignored(self):
+        params = Client.build_scrape_params(
+            retries=5, backoff=1.0, custom_headers={"X": "1"}, body="a=b"
+        )
+        assert params == {}
+
+    def test_scrape_uses_precomputed_base_params(self):
+        """scrape(base_params=...) sends exactly those params plus the url."""
+
+        async def run():
+            client = Client("fake-key")
+            captured: dict = {}
+
+            async def fake_get(path, params, headers=None):
+                captured["params"] = _clean_params(params)
+                return (b"{}", {}, 200)
+
+            with patch.object(client, "_get", new=AsyncMock(side_effect=fake_get)):
+                base = Client.build_scrape_params(render_js=True, wait=100)
+                await client.scrape("https://example.com", base_params=base, retries=0)
+            return captured
+
+        captured = asyncio.run(run())
+        assert captured["params"] == {
+            "url": "https://example.com",
+            "render_js": "true",
+            "wait": "100",
+        }
+
+
+class TestEncodeScrapeQuery:
+    """Tests for Client.encode_scrape_query() and the base_query scrape path."""
+
+    def test_round_trips_base_params(self):
+        from urllib.parse import parse_qs
+
+        base = Client.build_scrape_params(render_js=True, wait=200, country_code="us")
+        query = Client.encode_scrape_query(base)
+        assert parse_qs(query) == {
+            "render_js": ["true"],
+            "wait": ["200"],
+            "country_code": ["us"],
+        }
+
+    def test_drops_empty_values(self):
+        assert Client.encode_scrape_query({"a": "1", "b": "", "c": "x y"}) == "a=1&c=x+y"
+
+    def test_scrape_uses_pre_encoded_query(self):
+        """scrape(base_query=...) builds the full URL without re-encoding params."""
+        from urllib.parse import parse_qs, urlsplit
+
+        async def run():
+            client = Client("fake-key")
+            captured: dict = {}
+
+            async def fake_get_url(url, headers=None):
+                captured["url"] = str(url)
+                return (b"{}", {}, 200)
+
+            with patch.object(client, "_get_url", new=AsyncMock(side_effect=fake_get_url)):
+                base = Client.build_scrape_params(render_js=True, wait=100)
+                await client.scrape(
+                    "https://example.com/a b",
+                    base_params=base,
+                    base_query=Client.encode_scrape_query(base),
+                    retries=0,
+                )
+            return captured
+
+        captured = asyncio.run(run())
+        assert parse_qs(urlsplit(captured["url"]).query) == {
+            "render_js": ["true"],
+            "wait": ["100"],
+            "api_key": ["fake-key"],
+            "url": ["https://example.com/a b"],
+        }
+
+
 class TestTagParam:
     """Tests that --tag is forwarded as ?tag=... when set, and omitted when not."""
 
@@ -369,3 +504,85 @@ class TestGoogleGeo:
             assert "radius" not in captured["params"]
 
         asyncio.run(run())
+
+
+class TestResponseCache:
+    """Tests for the opt-in --cache-ttl response cache."""
+
+    def test_key_ignores_api_key_and_param_order(self, tmp_path, monkeypatch):
+        from scrapingbee_cli.client import response_cache_key
+
+        k1 = response_cache_key("/p", {"a": "1", "b": "2", "api_key": "secret"})
+        k2 = response_cache_key("/p", {"b": "2", "a": "1"})
+        assert k1 == k2
+        assert "secret" not in k1
+
+    def test_key_varies_with_request_headers(self):
+        from scrapingbee_cli.client import response_cache_key
+
+        base = response_cache_key("/p", {"a": "1"})
+        assert response_cache_key("/p", {"a": "1"}, {"Cookie": "A"}) != base
+        assert response_cache_key("/p", {"a": "1"}, {"Cookie": "A"}) != response_cache_key(
+            "/p", {"a": "1"}, {"Cookie": "B"}
+        )
+        # No headers and an empty header dict hash identically.
+        assert response_cache_key("/p", {"a": "1"}, {}) == base
+
+    def test_round_trip_and_expiry(self, tmp_path, monkeypatch):
+        from scrapingbee_cli.client import read_response_cache, write_response_cache
+
+        monkeypatch.setenv("SCRAPINGBEE_RESPONSE_CACHE_DIR", str(tmp_path))
+        write_response_cache("k", b"<html>", {"Spb-Cost": "1"}, 200)
+        assert read_response_cache("k", 60) == (b"<html>", {"Spb-Cost": "1"}, 200)
+        assert read_response_cache("missing", 60) is None
+
+    def test_stale_read_deletes_entry(self, tmp_path, monkeypatch):
+        from scrapingbee_cli.client import read_response_cache, write_response_cache
+
+        monkeypatch.setenv("SCRAPINGBEE_RESPONSE_CACHE_DIR", str(tmp_path))
+        write_response_cache("k", b"<html>", {}, 200)
+        assert read_response_cache("k", 0) is None  # ttl 0 — instantly stale
+        assert list(tmp_path.iterdir()) == []
+
+    def test_write_prunes_oldest_beyond_cap(self, tmp_path, monkeypatch):
+        from scrapingbee_cli import client as client_mod
+        from scrapingbee_cli.client import read_response_cache, write_response_cache
+
+        monkeypatch.setenv("SCRAPINGBEE_RESPONSE_CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(client_mod, "_CACHE_MAX_ENTRIES", 2)
+        for n in range(3):
+            write_response_cache(f"k{n}", b"x", {}, 200)
+            os.utime(tmp_path / f"k{n}.json", (n, n))  # deterministic ordering
+        write_response_cache("k3", b"x", {}, 200)
+        assert read_response_cache("k0", 60) is None
+        assert read_response_cache("k1", 60) is None
+        assert read_response_cache("k2", 60) is not None
+        assert read_response_cache("k3", 60) is not None
+
+    def test_get_serves_cached_without_network(self, tmp_path, monkeypatch):
+        from scrapingbee_cli.client import response_cache_key, write_response_cache
+
+        monkeypatch.setenv("SCRAPINGBEE_RESPONSE_CACHE_DIR", str(tmp_path))
+        params = {"q": "coffee"}
+        write_response_cache(response_cache_key("/s", params), b"{}", {}, 200)
+
+        async def run():
+            client = Client("fake-key", cache_ttl=60)
+            # No session opened: a network attempt would raise RuntimeError.
+            return await client._get("/s", dict(params))
+
+        assert asyncio.run(run()) == (b"{}", {}, 200)
+
+    def test_get_hits_network_when_disabled(self, tmp_path, monkeypatch):
+        from scrapingbee_cli.client import response_cache_key, write_response_cache
+
+        monkeypatch.setenv("SCRAPINGBEE_RESPONSE_CACHE_DIR", str(tmp_path))
+        params = {"q": "coffee"}
+        write_response_cache(response_cache_key("/s", params), b"{}", {}, 200)
+
+        async def run():
+            client = Client("fake-key")  # cache_ttl defaults to 0
+            with pytest.raises(RuntimeError):
+                await client._get("/s", dict(params))
+
+        asyncio.run(run())